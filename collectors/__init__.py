@@ -18,26 +18,48 @@ from collectors.base import (
     CircuitState,
     CollectorStatus
 )
-from collectors.elspot import ElspotCollector
-from collectors.entsoe import EntsoeCollector
-from collectors.entsoe_wind import EntsoeWindCollector
-from collectors.entsoe_flows import EntsoeFlowsCollector
-from collectors.entsoe_load import EntsoeLoadCollector
-from collectors.entsoe_generation import EntsoeGenerationCollector
-from collectors.entsoe_hydro import EntsoeHydroCollector
-from collectors.energyzero import EnergyZeroCollector
-from collectors.epex import EpexCollector
-from collectors.openweather import OpenWeatherCollector
-from collectors.googleweather import GoogleWeatherCollector
-from collectors.meteoserver import MeteoServerWeatherCollector, MeteoServerSunCollector
-from collectors.luchtmeetnet import LuchtmeetnetCollector
-from collectors.tennet import TennetCollector
-from collectors.ned import NedCollector
-from collectors.openmeteo_solar import OpenMeteoSolarCollector
-from collectors.openmeteo_weather import OpenMeteoWeatherCollector
-from collectors.market_proxies import MarketProxyCollector
-from collectors.gie_storage import GieStorageCollector
-from collectors.entsog_flows import EntsogFlowsCollector
+import importlib
+
+# Concrete collectors are imported on first attribute access (PEP 562), so
+# `from collectors import X` only pays for X's module (and its aiohttp /
+# pandas / entsoe-py imports), not for every collector in the package.
+_LAZY_IMPORTS = {
+    'ElspotCollector': 'collectors.elspot',
+    'EntsoeCollector': 'collectors.entsoe',
+    'EntsoeWindCollector': 'collectors.entsoe_wind',
+    'EntsoeFlowsCollector': 'collectors.entsoe_flows',
+    'EntsoeLoadCollector': 'collectors.entsoe_load',
+    'EntsoeGenerationCollector': 'collectors.entsoe_generation',
+    'EntsoeHydroCollector': 'collectors.entsoe_hydro',
+    'EnergyZeroCollector': 'collectors.energyzero',
+    'EpexCollector': 'collectors.epex',
+    'OpenWeatherCollector': 'collectors.openweather',
+    'GoogleWeatherCollector': 'collectors.googleweather',
+    'MeteoServerWeatherCollector': 'collectors.meteoserver',
+    'MeteoServerSunCollector': 'collectors.meteoserver',
+    'LuchtmeetnetCollector': 'collectors.luchtmeetnet',
+    'TennetCollector': 'collectors.tennet',
+    'NedCollector': 'collectors.ned',
+    'OpenMeteoSolarCollector': 'collectors.openmeteo_solar',
+    'OpenMeteoWeatherCollector': 'collectors.openmeteo_weather',
+    'MarketProxyCollector': 'collectors.market_proxies',
+    'GieStorageCollector': 'collectors.gie_storage',
+    'EntsogFlowsCollector': 'collectors.entsog_flows',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Base classes
@@ -35,16 +35,19 @@ Usage:
 """
 
 import asyncio
+import contextlib
 import copy
 import logging
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional, Any, List
+from typing import AsyncIterator, Dict, Optional, Any, List
 from enum import Enum
 import uuid
 
+import aiohttp
+
 from utils.data_types import EnhancedDataSet
 from utils.timezone_helpers import normalize_timestamp_to_amsterdam
 
@@ -219,6 +222,25 @@ class BaseCollector(ABC):
         # read this after concurrent collect() calls (the flag is per-instance).
         self.last_run_no_upstream_data: bool = False
 
+        # Optional aiohttp session injected by the orchestrator so collectors
+        # hitting the same hosts share one connection pool (keep-alive, DNS
+        # cache). The owner closes it; collectors never do.
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    @contextlib.asynccontextmanager
+    async def _client_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Yield the injected shared session, or a private one for this call.
+
+        Use as ``async with self._client_session() as session:`` in place of
+        ``async with aiohttp.ClientSession() as session:``.
+        """
+        if self.session is not None and not self.session.closed:
+            yield self.session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
     @abstractmethod
     async def _fetch_raw_data(
         self,
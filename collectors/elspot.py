@@ -231,21 +231,21 @@ class ElspotCollector(BaseCollector):
             self.logger.error(f"No 'values' field in Elspot data for {country_code}")
             return {}
 
-        data = {}
-
-        for day_data in area_data['values']:
-            timestamp = day_data['start']
-
-            # Handle naive datetime objects
+        def to_local(timestamp: datetime) -> datetime:
+            # Naive datetimes are localized; aware ones converted to the target zone
             if timestamp.tzinfo is None:
-                timestamp = localize_naive_datetime(timestamp, timezone)
-            else:
-                # Convert to target timezone
-                timestamp = timestamp.astimezone(timezone)
-
-            # Filter to requested time range
-            if start_time <= timestamp < end_time:
-                data[timestamp.isoformat()] = day_data['value']
+                return localize_naive_datetime(timestamp, timezone)
+            return timestamp.astimezone(timezone)
+
+        # Built in one comprehension, filtered to the requested time range
+        data = {
+            timestamp.isoformat(): value
+            for timestamp, value in (
+                (to_local(day_data['start']), day_data['value'])
+                for day_data in area_data['values']
+            )
+            if start_time <= timestamp < end_time
+        }
 
         self.logger.debug(f"Parsed {len(data)} data points from Elspot response")
 
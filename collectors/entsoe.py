@@ -64,6 +64,13 @@ class EntsoeCollector(BaseCollector):
             circuit_breaker_config=circuit_breaker_config
         )
         self.api_key = api_key
+        self._client = None
+
+    def _get_client(self) -> EntsoePandasClient:
+        """Create the entsoe-py client on first use and keep it, so retries reuse its HTTP session."""
+        if self._client is None:
+            self._client = EntsoePandasClient(api_key=self.api_key)
+        return self._client
 
     async def _fetch_raw_data(
         self,
@@ -96,8 +103,7 @@ class EntsoeCollector(BaseCollector):
             f"Querying ENTSO-E API: {start_timestamp} to {end_timestamp} (UTC)"
         )
 
-        # Create client
-        client = EntsoePandasClient(api_key=self.api_key)
+        client = self._get_client()
 
         # ENTSO-E API is synchronous, so we run in executor
         loop = asyncio.get_running_loop()
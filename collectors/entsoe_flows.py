@@ -139,10 +139,7 @@ class EntsoeFlowsCollector(BaseCollector):
         # Create client
         client = EntsoePandasClient(api_key=self.api_key)
 
-        # Fetch data for each border with per-border retry
-        results = {}
-
-        for from_zone, to_zone, border_name in self.borders:
+        async def fetch_border(from_zone: str, to_zone: str, border_name: str) -> Optional[pd.Series]:
             self.logger.debug(f"Fetching flow {border_name}")
 
             query_func = partial(
@@ -153,8 +150,13 @@ class EntsoeFlowsCollector(BaseCollector):
                 end=end_timestamp
             )
 
-            data = await self._retry_single(query_func)
+            return await self._retry_single(query_func)
+
+        # Fetch all borders concurrently, each with per-border retry
+        series = await asyncio.gather(*(fetch_border(*border) for border in self.borders))
+        results = {}
 
+        for (_, _, border_name), data in zip(self.borders, series):
             if data is not None and not data.empty:
                 results[border_name] = data
                 self.logger.debug(f"{border_name}: Got {len(data)} data points")
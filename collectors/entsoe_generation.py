@@ -168,10 +168,8 @@ class EntsoeGenerationCollector(BaseCollector):
         self.logger.debug(f"Query range: {start_timestamp} to {end_timestamp} (UTC)")
 
         client = EntsoePandasClient(api_key=self.api_key)
-        results = {}
-        loop = asyncio.get_running_loop()
 
-        for code in self.country_codes:
+        async def fetch_country(code: str) -> Dict[str, Any]:
             country_results = {}
 
             # Fetch actual generation per type (includes all types in one call)
@@ -237,8 +235,16 @@ class EntsoeGenerationCollector(BaseCollector):
                             country_results[gen_type]['forecast'] = forecast_df[matching_cols[0]]
                             self.logger.debug(f"{code} {gen_type} forecast: {len(forecast_df)} points")
 
-            if country_results:
-                results[code] = country_results
+            return country_results
+
+        # Fetch all countries concurrently (latency is the slowest country
+        # rather than the sum); actual and forecast stay sequential per country
+        per_country = await asyncio.gather(*(fetch_country(code) for code in self.country_codes))
+        results = {
+            code: country_results
+            for code, country_results in zip(self.country_codes, per_country)
+            if country_results
+        }
 
         if not results:
             raise ValueError("No generation data returned")
@@ -130,10 +130,8 @@ class EntsoeLoadCollector(BaseCollector):
         self.logger.debug(f"Query range: {start_timestamp} to {end_timestamp} (UTC)")
 
         client = EntsoePandasClient(api_key=self.api_key)
-        results = {}
-        loop = asyncio.get_running_loop()
 
-        for code in self.country_codes:
+        async def fetch_country(code: str) -> Dict[str, pd.Series]:
             country_data = {}
 
             # Fetch day-ahead forecast
@@ -173,8 +171,16 @@ class EntsoeLoadCollector(BaseCollector):
                 elif actual is not None:
                     self.logger.warning(f"{code}: No actual data")
 
-            if country_data:
-                results[code] = country_data
+            return country_data
+
+        # Fetch all countries concurrently (latency is the slowest country
+        # rather than the sum); forecast and actual stay sequential per country
+        per_country = await asyncio.gather(*(fetch_country(code) for code in self.country_codes))
+        results = {
+            code: country_data
+            for code, country_data in zip(self.country_codes, per_country)
+            if country_data
+        }
 
         if not results:
             raise ValueError("No load data returned from any country")
@@ -138,10 +138,7 @@ class EntsoeWindCollector(BaseCollector):
         # Create client
         client = EntsoePandasClient(api_key=self.api_key)
 
-        # Fetch data for each country with per-country retry
-        results = {}
-
-        for code in countries:
+        async def fetch_country(code: str) -> Optional[pd.DataFrame]:
             self.logger.debug(f"Fetching wind forecast for {code}")
 
             query_func = partial(
@@ -152,8 +149,14 @@ class EntsoeWindCollector(BaseCollector):
                 psr_type=None  # Get all types (wind onshore, wind offshore, solar)
             )
 
-            data = await self._retry_single(query_func)
+            return await self._retry_single(query_func)
+
+        # Fetch all countries concurrently, each with per-country retry
+        # (latency is the slowest country rather than the sum)
+        frames = await asyncio.gather(*(fetch_country(code) for code in countries))
+        results = {}
 
+        for code, data in zip(countries, frames):
             if data is not None and not data.empty:
                 results[code] = data
                 self.logger.debug(
@@ -224,7 +227,17 @@ class EntsoeWindCollector(BaseCollector):
                 f"offshore: {wind_offshore_col}, onshore: {wind_onshore_col}, total: {wind_total_col}"
             )
 
-            for timestamp, row in df.iterrows():
+            # Pull each wind column out once instead of building a Series per
+            # row with iterrows(); a missing column yields None (skipped below)
+            def column(col):
+                return df[col].tolist() if col else [None] * len(df)
+
+            for timestamp, offshore, onshore, total in zip(
+                df.index,
+                column(wind_offshore_col),
+                column(wind_onshore_col),
+                column(wind_total_col),
+            ):
                 # Convert to datetime
                 dt = timestamp.to_pydatetime()
 
@@ -237,14 +250,14 @@ class EntsoeWindCollector(BaseCollector):
                     # Extract wind values
                     wind_data = {}
 
-                    if wind_offshore_col and pd.notna(row.get(wind_offshore_col)):
-                        wind_data['wind_offshore'] = float(row[wind_offshore_col])
+                    if pd.notna(offshore):
+                        wind_data['wind_offshore'] = float(offshore)
 
-                    if wind_onshore_col and pd.notna(row.get(wind_onshore_col)):
-                        wind_data['wind_onshore'] = float(row[wind_onshore_col])
+                    if pd.notna(onshore):
+                        wind_data['wind_onshore'] = float(onshore)
 
-                    if wind_total_col and pd.notna(row.get(wind_total_col)):
-                        wind_data['wind_total'] = float(row[wind_total_col])
+                    if pd.notna(total):
+                        wind_data['wind_total'] = float(total)
 
                     # Calculate total if we have offshore + onshore but no total
                     if 'wind_offshore' in wind_data and 'wind_onshore' in wind_data and 'wind_total' not in wind_data:
@@ -28,13 +28,13 @@ Usage:
 """
 
 import asyncio
-import aiohttp
 import logging
 from datetime import datetime
 from typing import Dict, Optional, Any, List
 from zoneinfo import ZoneInfo
 
 from collectors.base import BaseCollector, RetryConfig, CircuitBreakerConfig
+from utils.helpers import loads_json
 
 
 class EntsogFlowsCollector(BaseCollector):
@@ -124,7 +124,7 @@ class EntsogFlowsCollector(BaseCollector):
 
         url = f"{self.BASE_URL}/operationaldata"
 
-        async with aiohttp.ClientSession() as session:
+        async with self._client_session() as session:
             async with session.get(url, params=params) as response:
                 if response.status != 200:
                     error_text = await response.text()
@@ -132,7 +132,7 @@ class EntsogFlowsCollector(BaseCollector):
                         f"ENTSOG API error {response.status}: {error_text[:200]}"
                     )
 
-                data = await response.json()
+                data = await response.json(loads=loads_json)
 
         # Extract operational data (API uses lowercase 'operationaldata')
         records = data.get('operationaldata', [])
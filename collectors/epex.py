@@ -28,10 +28,10 @@ Usage:
 import asyncio
 from datetime import datetime
 from typing import Any, Dict
-import aiohttp
 
 from collectors.base import BaseCollector, RetryConfig
-from utils.timezone_helpers import normalize_timestamp_to_amsterdam
+from utils.helpers import loads_json
+from utils.timezone_helpers import AMSTERDAM_TZ
 
 
 class EpexCollector(BaseCollector):
@@ -84,14 +84,14 @@ class EpexCollector(BaseCollector):
 
         url = f"{self.base_url}?start={start_ts}&end={end_ts}"
 
-        async with aiohttp.ClientSession() as session:
+        async with self._client_session() as session:
             async with session.get(url) as response:
                 if response.status != 200:
                     raise ValueError(
                         f"Awattar API returned status {response.status}"
                     )
 
-                data = await response.json()
+                data = await response.json(loads=loads_json)
 
         if not data or 'data' not in data:
             raise ValueError("No data returned from Awattar API")
@@ -118,20 +118,14 @@ class EpexCollector(BaseCollector):
         Returns:
             Dict mapping ISO timestamp strings to EUR/MWh prices
         """
-        data = {}
-
-        for item in raw_data['data']:
-            # Convert Unix timestamp (milliseconds) to datetime
-            timestamp = datetime.fromtimestamp(
-                item['start_timestamp'] / 1000,
-                tz=start_time.tzinfo
-            )
-
-            # Normalize to Amsterdam timezone
-            amsterdam_dt = normalize_timestamp_to_amsterdam(timestamp)
-
-            # Store price
-            data[amsterdam_dt.isoformat()] = float(item['marketprice'])
+        # Unix timestamps (milliseconds) are absolute, so convert them
+        # straight into Amsterdam time: one tz conversion per item
+        fromtimestamp = datetime.fromtimestamp
+        data = {
+            fromtimestamp(item['start_timestamp'] / 1000, tz=AMSTERDAM_TZ).isoformat():
+                float(item['marketprice'])
+            for item in raw_data['data']
+        }
 
         self.logger.debug(f"Parsed {len(data)} data points from Awattar response")
 
@@ -59,6 +59,7 @@ from typing import Any, Dict, List, Optional
 import aiohttp
 
 from collectors.base import BaseCollector, RetryConfig, CircuitBreakerConfig
+from utils.helpers import loads_json
 from utils.timezone_helpers import normalize_timestamp_to_amsterdam
 
 
@@ -206,7 +207,7 @@ class GoogleWeatherCollector(BaseCollector):
                             f"for {loc_str}: {error_text}"
                         )
 
-                    data = await response.json()
+                    data = await response.json(loads=loads_json)
 
                 # Store timezone from first page
                 if timezone_data is None and 'timeZone' in data:
@@ -27,14 +27,16 @@ Usage:
 
 import asyncio
 import json
+import os
 import re
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 import aiohttp
 
 from collectors.base import BaseCollector, RetryConfig
 from utils.timezone_helpers import normalize_timestamp_to_amsterdam
-from utils.helpers import closest
+from utils.helpers import closest, loads_json
 
 
 # Station-completeness thresholds for the data-quality signal emitted in
@@ -61,7 +63,8 @@ class LuchtmeetnetCollector(BaseCollector):
     measurements including AQI and various pollutants.
 
     Performance optimization: Caches station list for 24 hours to reduce
-    collection time from ~18s to ~2s.
+    collection time from ~18s to ~2s. With ``cache_dir`` set the list is also
+    kept on disk, so the cache survives between (cron-)runs.
     """
 
     # Class-level cache for station list (shared across instances)
@@ -79,7 +82,8 @@ class LuchtmeetnetCollector(BaseCollector):
         self,
         latitude: float,
         longitude: float,
-        retry_config: RetryConfig = None
+        retry_config: RetryConfig = None,
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize Luchtmeetnet collector.
@@ -88,6 +92,7 @@ class LuchtmeetnetCollector(BaseCollector):
             latitude: Latitude of location
             longitude: Longitude of location
             retry_config: Optional retry configuration
+            cache_dir: Optional directory for the on-disk station list cache
         """
         super().__init__(
             name="LuchtmeetnetCollector",
@@ -104,6 +109,9 @@ class LuchtmeetnetCollector(BaseCollector):
         # fetch (or copied from class snapshot on cache hit). Instance-scoped
         # so concurrent buurt collectors can't overwrite each other.
         self._last_filter_stats: Optional[Dict[str, int]] = None
+        self._cache_file = (
+            os.path.join(cache_dir, 'luchtmeetnet_station_cache.json') if cache_dir else None
+        )
 
     async def _fetch_raw_data(
         self,
@@ -131,7 +139,7 @@ class LuchtmeetnetCollector(BaseCollector):
             f"Fetching Luchtmeetnet data for lat={self.latitude}, lon={self.longitude}"
         )
 
-        async with aiohttp.ClientSession() as session:
+        async with self._client_session() as session:
             # Step 1: Get all stations (with caching)
             stations = await self._get_stations_cached(session)
 
@@ -193,6 +201,20 @@ class LuchtmeetnetCollector(BaseCollector):
                 self._last_filter_stats = LuchtmeetnetCollector._cache_filter_stats
                 return LuchtmeetnetCollector._station_cache
 
+        # Each run is a fresh process, so fall back to the copy a previous run
+        # left on disk before paying for the full station crawl
+        disk_cache = self._load_station_disk_cache()
+        if disk_cache is not None:
+            stations, filter_stats, age_seconds = disk_cache
+            LuchtmeetnetCollector._station_cache = stations
+            LuchtmeetnetCollector._cache_filter_stats = filter_stats
+            LuchtmeetnetCollector._cache_timestamp = now - timedelta(seconds=age_seconds)
+            self._last_filter_stats = filter_stats
+            self.logger.info(
+                f"Using on-disk station list (age: {age_seconds/3600:.1f}h)"
+            )
+            return stations
+
         # Cache miss or expired - fetch new data
         self.logger.info("Station cache miss or expired, fetching fresh data")
         stations = await self._fetch_all_stations(session)
@@ -205,6 +227,7 @@ class LuchtmeetnetCollector(BaseCollector):
             LuchtmeetnetCollector._station_cache = stations
             LuchtmeetnetCollector._cache_filter_stats = self._last_filter_stats
             LuchtmeetnetCollector._cache_timestamp = now
+            self._save_station_disk_cache(stations, self._last_filter_stats)
             self.logger.info(f"Cached {len(stations)} stations")
         else:
             self.logger.warning(
@@ -214,6 +237,50 @@ class LuchtmeetnetCollector(BaseCollector):
 
         return stations
 
+    def _load_station_disk_cache(self) -> Optional[tuple]:
+        """
+        Load the on-disk station list if present and younger than the cache duration.
+
+        Returns:
+            (stations, filter_stats, age_seconds), or None on miss/expiry/corruption
+        """
+        if not self._cache_file or not os.path.exists(self._cache_file):
+            return None
+        try:
+            with open(self._cache_file) as f:
+                cached = json.load(f)
+            age_seconds = time.time() - float(cached['cached_at'])
+            if not 0 <= age_seconds < self._cache_duration.total_seconds():
+                return None
+            # Same allowlist as a live fetch: the file is outside our control
+            stations = [
+                s for s in cached['stations']
+                if isinstance(s.get('number'), str) and _STATION_NUMBER_PATTERN.match(s['number'])
+            ]
+            if not stations:
+                return None
+            return stations, cached.get('filter_stats'), age_seconds
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            self.logger.warning(f"Ignoring unreadable station cache: {e}")
+            return None
+
+    def _save_station_disk_cache(self, stations: List[Dict], filter_stats: Optional[Dict[str, int]]) -> None:
+        """Write the station list to disk (atomically); failures only log."""
+        if not self._cache_file:
+            return
+        temp_file = self._cache_file + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self._cache_file) or '.', exist_ok=True)
+            with open(temp_file, 'w') as f:
+                f.write(json.dumps({
+                    'cached_at': time.time(),
+                    'filter_stats': filter_stats,
+                    'stations': stations,
+                }))
+            os.replace(temp_file, self._cache_file)
+        except OSError as e:
+            self.logger.warning(f"Could not write station cache: {e}")
+
     async def _fetch_all_stations(self, session: aiohttp.ClientSession) -> List[Dict]:
         """Fetch all Luchtmeetnet stations with their details."""
         self.logger.debug("Fetching station list")
@@ -224,7 +291,7 @@ class LuchtmeetnetCollector(BaseCollector):
             if response.status != 200:
                 raise ValueError(f"API returned status {response.status}")
 
-            data = await response.json()
+            data = await response.json(loads=loads_json)
             page_list = list(data['pagination']['page_list'])
 
         # Fetch all pages
@@ -235,7 +302,7 @@ class LuchtmeetnetCollector(BaseCollector):
                 if response.status != 200:
                     raise ValueError(f"API returned status {response.status}")
 
-                data = await response.json()
+                data = await response.json(loads=loads_json)
                 station_list.extend(data['data'])
 
         self.logger.debug(f"Found {len(station_list)} stations, fetching details...")
@@ -258,7 +325,7 @@ class LuchtmeetnetCollector(BaseCollector):
                     if response.status != 200:
                         continue  # Skip stations with errors
 
-                    data = await response.json()
+                    data = await response.json(loads=loads_json)
                     station_data = data['data']
 
                     # Extract coordinates and metadata. Accept both 'point' (current
@@ -325,7 +392,7 @@ class LuchtmeetnetCollector(BaseCollector):
             if response.status != 200:
                 raise ValueError(f"API returned status {response.status}")
 
-            data = await response.json()
+            data = await response.json(loads=loads_json)
             return data.get('data', [])
 
     async def _fetch_measurements(
@@ -342,7 +409,7 @@ class LuchtmeetnetCollector(BaseCollector):
             if response.status != 200:
                 raise ValueError(f"API returned status {response.status}")
 
-            data = await response.json()
+            data = await response.json(loads=loads_json)
             return data.get('data', [])
 
     def _parse_response(
@@ -47,6 +47,7 @@ from zoneinfo import ZoneInfo
 import holidays
 
 from collectors.base import BaseCollector, RetryConfig, CircuitBreakerConfig
+from utils.helpers import loads_json
 
 # Try importing yfinance as fallback
 try:
@@ -105,6 +106,12 @@ class MarketProxyCollector(BaseCollector):
 
     # Cache settings
     CACHE_EXPIRATION_SECONDS = 48 * 3600  # 48 hours
+    # Within this window the cache is served instead of re-querying the APIs
+    # (Alpha Vantage free tier is 25 requests/day; quotes only move on trading days)
+    CACHE_FRESH_SECONDS = 6 * 3600  # 6 hours
+    # A cache only counts as fresh when every proxy made it in; a partial fetch
+    # is still saved as a fallback but does not suppress the next attempt
+    CACHE_KEYS = ('carbon', 'gas_ttf', 'gas')
     # Cache integrity key (derived from machine-specific data for portability)
     _CACHE_HMAC_KEY = hashlib.sha256(
         f"market_proxy_cache_{os.getenv('COMPUTERNAME', os.getenv('HOSTNAME', 'default'))}".encode()
@@ -336,7 +343,7 @@ class MarketProxyCollector(BaseCollector):
                     return None
 
                 try:
-                    data = await response.json()
+                    data = await response.json(loads=loads_json)
                 except (aiohttp.ContentTypeError, json.JSONDecodeError) as e:
                     self.logger.debug(f"Alpha Vantage {symbol}: JSON decode error - {e}")
                     return None
@@ -420,7 +427,7 @@ class MarketProxyCollector(BaseCollector):
                     return None
 
                 try:
-                    data = await response.json()
+                    data = await response.json(loads=loads_json)
                 except (aiohttp.ContentTypeError, json.JSONDecodeError) as e:
                     self.logger.debug(f"Alpha Vantage history {symbol}: JSON decode error - {e}")
                     return None
@@ -736,6 +743,13 @@ class MarketProxyCollector(BaseCollector):
         Returns:
             Dict with 'carbon' and 'gas' price data
         """
+        # Re-runs within the fresh window reuse the last successful fetch
+        if self._cache_file:
+            fresh = self._load_cache(max_age_seconds=self.CACHE_FRESH_SECONDS)
+            if fresh and all(key in fresh for key in self.CACHE_KEYS):
+                self.logger.info("Using fresh market proxy cache; skipping API calls")
+                return fresh
+
         self.logger.debug("Fetching market proxy data via Alpha Vantage")
 
         results = {}
@@ -881,8 +895,14 @@ class MarketProxyCollector(BaseCollector):
             hashlib.sha256
         ).hexdigest()
 
-    def _load_cache(self) -> Optional[Dict[str, Any]]:
-        """Load cached data if available, recent, and integrity verified."""
+    def _load_cache(self, max_age_seconds: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Load cached data if available, recent, and integrity verified.
+
+        Args:
+            max_age_seconds: Maximum cache age to accept (defaults to CACHE_EXPIRATION_SECONDS)
+        """
+        if max_age_seconds is None:
+            max_age_seconds = self.CACHE_EXPIRATION_SECONDS
         if not self._cache_file or not os.path.exists(self._cache_file):
             return None
 
@@ -911,7 +931,7 @@ class MarketProxyCollector(BaseCollector):
             if cache_time.tzinfo is None:
                 cache_time = cache_time.replace(tzinfo=ZoneInfo('Europe/Amsterdam'))
 
-            if (now - cache_time).total_seconds() < self.CACHE_EXPIRATION_SECONDS:
+            if (now - cache_time).total_seconds() < max_age_seconds:
                 return cached.get('data')
         except Exception as e:
             self.logger.debug(f"Cache load error: {e}")
@@ -939,7 +959,7 @@ class MarketProxyCollector(BaseCollector):
             # Write atomically via temp file to prevent corruption
             temp_file = self._cache_file + '.tmp'
             with open(temp_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+                f.write(json.dumps(cache_data, indent=2))
 
             # Set restrictive permissions (owner read/write only)
             try:
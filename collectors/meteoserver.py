@@ -34,6 +34,7 @@ from typing import Any, Dict
 import aiohttp
 
 from collectors.base import BaseCollector, RetryConfig
+from utils.helpers import loads_json
 from utils.timezone_helpers import normalize_timestamp_to_amsterdam
 
 
@@ -112,7 +113,7 @@ class MeteoServerWeatherCollector(BaseCollector):
                         f"MeteoServer API returned status {response.status}"
                     )
 
-                data = await response.json()
+                data = await response.json(loads=loads_json)
 
         if not data or 'data' not in data:
             raise ValueError("No data field in MeteoServer response")
@@ -308,7 +309,7 @@ class MeteoServerSunCollector(BaseCollector):
                         f"MeteoServer API returned status {response.status}"
                     )
 
-                data = await response.json()
+                data = await response.json(loads=loads_json)
 
         if not data or 'forecast' not in data:
             raise ValueError("No forecast field in MeteoServer response")
@@ -48,6 +48,7 @@ from zoneinfo import ZoneInfo
 import aiohttp
 
 from collectors.base import BaseCollector, RetryConfig, CircuitBreakerConfig
+from utils.helpers import loads_json
 from collectors._openmeteo_shared import (
     OPENMETEO_SEMAPHORE,
     OPENMETEO_GAP_SECONDS,
@@ -146,7 +147,7 @@ class OpenMeteoOffshoreWindCollector(BaseCollector):
                     )
                     return {"name": location["name"], "data": None, "error": error_text}
 
-                data = await response.json()
+                data = await response.json(loads=loads_json)
                 return {"name": location["name"], "data": data, "error": None}
 
         except Exception as e:
@@ -56,6 +56,7 @@ from collectors._openmeteo_shared import (
 )
 
 from collectors.base import BaseCollector, RetryConfig, CircuitBreakerConfig
+from utils.helpers import loads_json
 from utils.timezone_helpers import normalize_timestamp_to_amsterdam
 
 
@@ -142,7 +143,7 @@ class OpenMeteoSolarCollector(BaseCollector):
                     )
                     return {"name": location["name"], "data": None, "error": error_text}
 
-                data = await response.json()
+                data = await response.json(loads=loads_json)
                 return {"name": location["name"], "data": data, "error": None}
 
         except Exception as e:
@@ -31,6 +31,7 @@ from typing import Any, Dict
 import aiohttp
 
 from collectors.base import BaseCollector, RetryConfig
+from utils.helpers import loads_json
 from utils.timezone_helpers import normalize_timestamp_to_amsterdam
 
 
@@ -108,7 +109,7 @@ class OpenWeatherCollector(BaseCollector):
                         f"OpenWeather API returned status {response.status}"
                     )
 
-                data = await response.json()
+                data = await response.json(loads=loads_json)
 
         if not data or 'list' not in data:
             raise ValueError("No forecast data returned from OpenWeather API")
@@ -381,7 +382,7 @@ async def get_OpenWeather_geographical_coordinates_in_NL(api_key: str, plaats: s
         async with aiohttp.ClientSession() as session:
             async with session.get(url, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=loads_json)
                     if data:
                         latitude = data[0]["lat"]
                         longitude = data[0]["lon"]
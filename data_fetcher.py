@@ -36,7 +36,7 @@ Description:
 
 Dependencies:
     - aiohttp: For async HTTP requests
-    - pytz: Timezone handling
+    - zoneinfo: Timezone handling
     - pandas: Data manipulation
     - cryptography: Data encryption/decryption
     Required local packages:
@@ -60,17 +60,27 @@ import os
 import sys
 import json
 import copy
-import shutil
 import configparser
+import importlib
 from collections.abc import Awaitable
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 from datetime import datetime, timedelta
 import asyncio
 import logging
+import aiohttp
 import base64
 import platform
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener
 
-from utils.helpers import ensure_output_directory, load_settings, load_secrets, save_data_file, load_data_file
+# uvloop is optional: a faster drop-in event loop on Linux/macOS
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from utils.helpers import ensure_output_directory, load_settings, load_secrets, save_data_file, load_data_file, link_or_copy, dumps_json
 from utils.data_quality import (
     validate_pipeline,
     update_upstream_empty_streaks,
@@ -105,16 +115,27 @@ from collectors import (
     # in main() to restore.
     LuchtmeetnetCollector,
     TennetCollector,
-    NedCollector,
     OpenMeteoSolarCollector,
     OpenMeteoWeatherCollector,
-    MarketProxyCollector,
-    GieStorageCollector,
     EntsogFlowsCollector,
     RetryConfig
 )
 from collectors.openmeteo_offshore_wind import OpenMeteoOffshoreWindCollector
 
+# Collectors that only run when their API key is configured. They are
+# imported on demand so a run without those keys skips their module imports.
+_OPTIONAL_COLLECTORS = {
+    'ned': 'collectors.ned:NedCollector',
+    'market_proxy': 'collectors.market_proxies:MarketProxyCollector',
+    'gie_storage': 'collectors.gie_storage:GieStorageCollector',
+}
+
+
+def _load_collector(name: str) -> type:
+    """Import and return an optional collector class by registry name."""
+    module, cls = _OPTIONAL_COLLECTORS[name].split(':')
+    return getattr(importlib.import_module(module), cls)
+
 # Constants
 LOGGING_FILE_NAME = 'energy_data_fetcher.log'
 SETTINGS_FILE_NAME = 'settings.ini'
@@ -122,6 +143,11 @@ SECRETS_FILE_NAME = 'secrets.ini'
 OUTPUT_FOLDER_NAME = 'data'
 output_path = os.path.join(os.getcwd(), OUTPUT_FOLDER_NAME)
 
+# Upper bound on one collector's collect() (its own retries included). The
+# slowest legitimate case is ENTSO-E flows with ~6 min of backoff; a collector
+# that hangs past this is treated as failed (None) instead of stalling the run.
+COLLECTOR_TIMEOUT_SECONDS = 900
+
 # Retry settings for critical collectors
 RETRY_DELAY_SECONDS = 300  # 5 minutes between retry rounds
 MAX_RETRY_ROUNDS = 3       # Up to 3 retry rounds for failed critical collectors
@@ -143,6 +169,54 @@ MAX_RETRY_ROUNDS = 3       # Up to 3 retry rounds for failed critical collectors
 CRITICAL_DATASETS = {'entsoe', 'entsoe_de'}
 
 
+# Offshore wind farm locations - actual open-sea coordinates
+# These are fetched via Open-Meteo (supports offshore) instead of Google Weather (404 errors)
+# Static, so defined once here rather than rebuilt inside main() on every run.
+OFFSHORE_WIND_LOCATIONS = [
+    # Dutch offshore wind farms
+    {"name": "Borssele_NL", "lat": 51.7000, "lon": 3.0000},      # Borssele wind farm area (1.5 GW)
+    {"name": "HollandseKust_NL", "lat": 52.5000, "lon": 4.2000}, # Hollandse Kust (3.5 GW planned)
+    {"name": "Gemini_NL", "lat": 54.0361, "lon": 5.9625},        # Gemini wind farm (600 MW)
+    {"name": "IJmuidenVer_NL", "lat": 52.8500, "lon": 3.5000},   # IJmuiden Ver (4 GW planned)
+
+    # German Bight (major capacity)
+    {"name": "HelgolandCluster_DE", "lat": 54.2000, "lon": 7.5000},  # German offshore cluster
+    {"name": "BorkumRiffgrund_DE", "lat": 53.9667, "lon": 6.5500},   # Borkum Riffgrund area
+
+    # UK Dogger Bank (world's largest offshore wind farm)
+    {"name": "DoggerBank_UK", "lat": 54.7500, "lon": 2.5000},    # Dogger Bank (3.6 GW)
+
+    # Danish North Sea
+    {"name": "HornsRev_DK", "lat": 55.4833, "lon": 7.8500},      # Horns Rev wind farms
+
+    # Belgian offshore
+    {"name": "NorthSeaBE_BE", "lat": 51.5833, "lon": 2.8000},    # Belgian offshore cluster
+]
+
+
+# Population centers for demand prediction (temperature affects heating/cooling demand)
+# Major cities weighted by population for aggregated demand estimation
+POPULATION_CENTERS = [
+    # Netherlands - major population centers (17.5M total)
+    {"name": "Amsterdam_NL", "lat": 52.3676, "lon": 4.9041, "population": 872680},
+    {"name": "Rotterdam_NL", "lat": 51.9225, "lon": 4.4792, "population": 651446},
+    {"name": "The_Hague_NL", "lat": 52.0705, "lon": 4.3007, "population": 545838},
+    {"name": "Utrecht_NL", "lat": 52.0907, "lon": 5.1214, "population": 361924},
+    {"name": "Eindhoven_NL", "lat": 51.4416, "lon": 5.4697, "population": 238478},
+    {"name": "Groningen_NL", "lat": 53.2194, "lon": 6.5665, "population": 233273},
+
+    # Germany - key population centers in coupled market regions
+    {"name": "Dusseldorf_DE", "lat": 51.2277, "lon": 6.7735, "population": 620523},   # Near NL border
+    {"name": "Cologne_DE", "lat": 50.9375, "lon": 6.9603, "population": 1083498},    # Rhineland
+    {"name": "Hamburg_DE", "lat": 53.5511, "lon": 9.9937, "population": 1906411},    # North Germany
+
+    # Belgium - coupled market
+    {"name": "Brussels_BE", "lat": 50.8503, "lon": 4.3517, "population": 1222637},
+    {"name": "Antwerp_BE", "lat": 51.2194, "lon": 4.4025, "population": 530630},
+]
+TOTAL_POPULATION = sum(loc.get('population', 0) for loc in POPULATION_CENTERS)
+
+
 # Per-location Luchtmeetnet metadata fields preserved (per-station) under
 # `metadata['stations'][<loc>]` in the buurt air-quality envelope.
 # `components` is the list of pollutants the station actually measures —
@@ -238,19 +312,98 @@ def assemble_buurt_air_envelope(buurt_locations, buurt_aq_data):
     return EnhancedDataSet(metadata=air_metadata, data=buurt_air_data)
 
 
-# Setup logging with UTF-8 encoding (Windows console defaults to cp1252)
-_stream_handler = logging.StreamHandler()
-_stream_handler.stream = open(sys.stdout.fileno(), mode='w', encoding='utf-8', closefd=False)
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s %(levelname)s %(message)s',
-    handlers=[
-        _stream_handler,
-        logging.FileHandler(os.path.join(output_path, LOGGING_FILE_NAME), encoding='utf-8')]
+def save_feed(data, name: str, run_ts: str, handler, encrypt: bool) -> str:
+    """Save a timestamped ``<run_ts>_<name>.json`` and refresh the ``<name>.json`` copy.
+
+    Returns:
+        Path of the timestamped file.
+    """
+    full_path = os.path.join(output_path, f"{run_ts}_{name}.json")
+    save_data_file(data=data, file_path=full_path, handler=handler, encrypt=encrypt)
+    link_or_copy(full_path, os.path.join(output_path, f"{name}.json"))
+    return full_path
+
+
+def _write_shape_records(sidecar: Dict[str, Any], sidecar_path: str, observations_path: str) -> None:
+    """Write the shape-signature sidecar and append it to the observation log."""
+    _write_json_file(sidecar_path, sidecar)
+    logging.info(
+        f"Shape-signature sidecar written: {len(sidecar['feeds'])} feeds, "
+        f"schema_version={CURRENT_SCHEMA_VERSION} → {sidecar_path}"
     )
 
+    # #43: the learning record. The sidecar above is the drift tripwire's
+    # BASELINE and must only advance on a passing run; this is the HISTORY
+    # the volatility classifier learns from and must record every run,
+    # including ones the tripwire fails. Keeping both roles in one file
+    # meant a failing run taught the classifier nothing, so a transient that
+    # tripped the gate would trip it again forever.
+    try:
+        append_shape_observation(observations_path, sidecar)
+        logging.info(f"Shape observation appended → {observations_path}")
+    except OSError as e:
+        # Never fail a collection over the learning record.
+        logging.warning(f"Could not append shape observation: {e}")
+
+
+def _write_json_file(path: str, obj: Any) -> None:
+    with open(path, 'wb') as f:
+        f.write(dumps_json(obj, indent=True))
+
+
+async def _labelled(key: str, coro: Awaitable) -> tuple[str, Any]:
+    """Await ``coro`` and tag its result with ``key`` (as_completed loses the mapping).
+
+    Bounded by COLLECTOR_TIMEOUT_SECONDS; a timeout yields ``None``, the same
+    value BaseCollector.collect() returns on failure.
+    """
+    try:
+        async with asyncio.timeout(COLLECTOR_TIMEOUT_SECONDS):
+            return key, await coro
+    except TimeoutError:
+        logging.error("Collector task '%s' timed out after %ds", key, COLLECTOR_TIMEOUT_SECONDS)
+        return key, None
+
+
+def configure_logging() -> None:
+    """
+    Send log records to the console and the log file via a background listener.
+
+    Called at the start of main() rather than at import, so importing this
+    module (e.g. from tests) starts no thread and touches no file. A no-op
+    when the root logger already has handlers.
+    """
+    if logging.getLogger().handlers:
+        return
+    # UTF-8 console stream (Windows console defaults to cp1252)
+    stream_handler = logging.StreamHandler()
+    stream_handler.stream = open(sys.stdout.fileno(), mode='w', encoding='utf-8', closefd=False)
+    # Records are formatted by the QueueHandler in the calling thread, then written
+    # by a background listener, so the console and file writes never block the
+    # event loop while collectors are in flight.
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(
+        log_queue,
+        stream_handler,
+        # delay: the file is only opened on the first record
+        logging.FileHandler(os.path.join(output_path, LOGGING_FILE_NAME), encoding='utf-8', delay=True),
+        respect_handler_level=True,
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)  # Flush anything still queued on exit
+    # The format uses none of these, so skip collecting them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s %(levelname)s %(message)s',
+        handlers=[QueueHandler(log_queue)]
+        )
+
 async def main() -> None:
     """Main function to orchestrate the data fetching and writing process."""
+    configure_logging()
     script_dir = os.path.dirname(os.path.abspath(__file__))
     ensure_output_directory(output_path)
 
@@ -315,29 +468,6 @@ async def main() -> None:
             {"name": "Esbjerg_DK", "lat": 55.4760, "lon": 8.4516},      # North Sea wind
         ]
 
-        # Offshore wind farm locations - actual open-sea coordinates
-        # These are fetched via Open-Meteo (supports offshore) instead of Google Weather (404 errors)
-        offshore_wind_locations = [
-            # Dutch offshore wind farms
-            {"name": "Borssele_NL", "lat": 51.7000, "lon": 3.0000},      # Borssele wind farm area (1.5 GW)
-            {"name": "HollandseKust_NL", "lat": 52.5000, "lon": 4.2000}, # Hollandse Kust (3.5 GW planned)
-            {"name": "Gemini_NL", "lat": 54.0361, "lon": 5.9625},        # Gemini wind farm (600 MW)
-            {"name": "IJmuidenVer_NL", "lat": 52.8500, "lon": 3.5000},   # IJmuiden Ver (4 GW planned)
-
-            # German Bight (major capacity)
-            {"name": "HelgolandCluster_DE", "lat": 54.2000, "lon": 7.5000},  # German offshore cluster
-            {"name": "BorkumRiffgrund_DE", "lat": 53.9667, "lon": 6.5500},   # Borkum Riffgrund area
-
-            # UK Dogger Bank (world's largest offshore wind farm)
-            {"name": "DoggerBank_UK", "lat": 54.7500, "lon": 2.5000},    # Dogger Bank (3.6 GW)
-
-            # Danish North Sea
-            {"name": "HornsRev_DK", "lat": 55.4833, "lon": 7.8500},      # Horns Rev wind farms
-
-            # Belgian offshore
-            {"name": "NorthSeaBE_BE", "lat": 51.5833, "lon": 2.8000},    # Belgian offshore cluster
-        ]
-
         # Google Weather uses only strategic onshore locations (doesn't support open-sea)
         # Offshore wind data comes from Open-Meteo instead
         all_weather_locations = strategic_locations
@@ -359,27 +489,6 @@ async def main() -> None:
             {"name": "Antwerp_BE", "lat": 51.2194, "lon": 4.4025},        # Flanders solar
         ]
 
-        # Population centers for demand prediction (temperature affects heating/cooling demand)
-        # Major cities weighted by population for aggregated demand estimation
-        population_centers = [
-            # Netherlands - major population centers (17.5M total)
-            {"name": "Amsterdam_NL", "lat": 52.3676, "lon": 4.9041, "population": 872680},
-            {"name": "Rotterdam_NL", "lat": 51.9225, "lon": 4.4792, "population": 651446},
-            {"name": "The_Hague_NL", "lat": 52.0705, "lon": 4.3007, "population": 545838},
-            {"name": "Utrecht_NL", "lat": 52.0907, "lon": 5.1214, "population": 361924},
-            {"name": "Eindhoven_NL", "lat": 51.4416, "lon": 5.4697, "population": 238478},
-            {"name": "Groningen_NL", "lat": 53.2194, "lon": 6.5665, "population": 233273},
-
-            # Germany - key population centers in coupled market regions
-            {"name": "Dusseldorf_DE", "lat": 51.2277, "lon": 6.7735, "population": 620523},   # Near NL border
-            {"name": "Cologne_DE", "lat": 50.9375, "lon": 6.9603, "population": 1083498},    # Rhineland
-            {"name": "Hamburg_DE", "lat": 53.5511, "lon": 9.9937, "population": 1906411},    # North Germany
-
-            # Belgium - coupled market
-            {"name": "Brussels_BE", "lat": 50.8503, "lon": 4.3517, "population": 1222637},
-            {"name": "Antwerp_BE", "lat": 51.2194, "lon": 4.4025, "population": 530630},
-        ]
-
         # Buurt-level (Dutch neighbourhood) centroids for FyE B1 short-horizon
         # supply/demand forecasting at Lifeport Arnhem-Velp scale. Added
         # 2026-06-05; centroids computed from CBS Wijken en Buurten polygons
@@ -394,6 +503,9 @@ async def main() -> None:
 
         # Calculate day boundaries for proper day-ahead forecasting
         current_time = datetime.now(timezone)
+        # One filename stamp for the whole run, so every file of a run shares it
+        # even when saves straddle a second boundary. Host-local, as before.
+        run_ts = current_time.astimezone().strftime('%y%m%d_%H%M%S')
 
         # Start from beginning of current day
         today = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -454,7 +566,7 @@ async def main() -> None:
         # Uses actual offshore coordinates - Open-Meteo's global models support open-sea locations
         # Unlike Google Weather which returns 404 for offshore coordinates
         openmeteo_offshore_wind_collector = OpenMeteoOffshoreWindCollector(
-            locations=offshore_wind_locations,
+            locations=OFFSHORE_WIND_LOCATIONS,
             forecast_days=10  # 10-day forecast for price prediction
         )
 
@@ -468,7 +580,7 @@ async def main() -> None:
         # Only initialize if API key is available (requires registration approval)
         ned_collector = None
         if ned_api_key:
-            ned_collector = NedCollector(
+            ned_collector = _load_collector('ned')(
                 api_key=ned_api_key,
                 energy_types=['solar', 'wind_onshore', 'wind_offshore'],
                 include_forecast=True,
@@ -486,7 +598,7 @@ async def main() -> None:
         # Open-Meteo Weather collector for demand prediction (FREE - no API key)
         # Temperature at population centers affects electricity DEMAND (heating/cooling)
         openmeteo_weather_collector = OpenMeteoWeatherCollector(
-            locations=population_centers,
+            locations=POPULATION_CENTERS,
             forecast_days=7  # 7-day weather forecast
         )
 
@@ -515,7 +627,7 @@ async def main() -> None:
         # RIVM monitoring station. Outputs combined into air_quality_buurt.json.
         # Last-24h historical readings (not a forecast).
         luchtmeetnet_buurt_collectors = [
-            LuchtmeetnetCollector(latitude=loc['lat'], longitude=loc['lon'])
+            LuchtmeetnetCollector(latitude=loc['lat'], longitude=loc['lon'], cache_dir=output_path)
             for loc in buurt_locations
         ]
 
@@ -573,7 +685,7 @@ async def main() -> None:
         # Carbon and gas prices are key drivers of electricity prices
         market_proxy_collector = None
         if alpha_vantage_api_key:
-            market_proxy_collector = MarketProxyCollector(
+            market_proxy_collector = _load_collector('market_proxy')(
                 api_key=alpha_vantage_api_key,
                 cache_dir=output_path
             )
@@ -582,7 +694,7 @@ async def main() -> None:
         # Gas storage levels affect gas prices and electricity prices (gas-fired plants)
         gie_collector = None
         if gie_api_key:
-            gie_collector = GieStorageCollector(
+            gie_collector = _load_collector('gie_storage')(
                 api_key=gie_api_key,
                 country_code='NL'
             )
@@ -592,8 +704,8 @@ async def main() -> None:
         entsog_flows_collector = EntsogFlowsCollector(country_code='NL')
 
         # Collect data from all sources (national/regional for price prediction).
-        # Named (key, coroutine) pairs — results are reassembled into a dict
-        # after gather, so adding/removing a task requires no index accounting.
+        # Named (key, coroutine) pairs — results are collected into a dict as
+        # they complete, so adding/removing a task requires no index accounting.
         task_specs: list[tuple[str, Awaitable]] = [
             ('entsoe_nl', entsoe_collector.collect(today, tomorrow, country_code=country_code)),
             ('entsoe_de', entsoe_collector_de.collect(today, tomorrow, country_code='DE_LU')),  # German prices (coupled market)
@@ -632,16 +744,83 @@ async def main() -> None:
         # ENTSOG gas flows — always collected (no API key required)
         task_specs.append(('entsog_flows', entsog_flows_collector.collect(yesterday, today)))
 
-        # NOTE: deliberately NOT using return_exceptions=True.
-        # BaseCollector.collect() traps internally and returns None on failure
-        # (see collectors/base.py). The downstream `if X_data:` truthiness
-        # checks rely on this — they would falsely pass for a non-None
-        # exception object if gather started surfacing exceptions. Don't
-        # change this flag without also adding explicit isinstance(_, BaseException)
-        # checks before the per-collector save blocks.
-        keys, coros = zip(*task_specs)
-        result_list = await asyncio.gather(*coros)
-        results: dict[str, Any] = dict(zip(keys, result_list))
+        # Feeds whose published file depends only on their own collector's
+        # result are saved the moment that collector finishes, so encryption
+        # and the disk write overlap the slower collectors still in flight.
+        # Everything that needs the whole batch (price retry rounds, the
+        # Open-Meteo grace, the wind/buurt assemblies) is saved after the loop.
+        # Value: (output file stem, log summary of the saved dataset).
+        eager_feeds: Dict[str, tuple[str, Callable[[EnhancedDataSet], str]]] = {
+            'tennet': ('grid_imbalance', lambda ds:
+                f"TenneT grid imbalance data with {ds.metadata.get('data_points', 0)} data points"),
+            'ned': ('ned_production', lambda ds:
+                f"NED.nl production data for {len(ds.metadata.get('energy_types', []))} "
+                f"energy types: {ds.metadata.get('energy_types', [])}"),
+            'entsoe_flows': ('cross_border_flows', lambda ds:
+                f"cross-border flows for {len(ds.data.get('summary', {}).get('borders', []))} borders, "
+                f"avg net: {ds.data.get('summary', {}).get('avg_net_position', 0)} MW"),
+            'entsoe_load': ('load_forecast', lambda ds:
+                f"load forecast for {len(ds.data)} countries"),
+            'entsoe_generation': ('generation_forecast', lambda ds:
+                f"generation data for {len(ds.data)} countries (nuclear availability)"),
+            'entsoe_hydro': ('nordic_hydro', lambda ds:
+                f"Nordic hydro reservoirs for {len(ds.data)} zones: {list(ds.data.keys())}"),
+            'entsoe_genmix': ('generation_mix', lambda ds:
+                f"generation mix for {len(ds.data)} countries: {list(ds.data.keys())}"),
+            'market_proxy': ('market_proxies', lambda ds:
+                f"market proxies: carbon=${ds.data.get('carbon', {}).get('price', 'N/A')}, "
+                f"gas=${ds.data.get('gas', {}).get('price', 'N/A')}"),
+            'gie_storage': ('gas_storage', lambda ds:
+                f"gas storage data: {len(ds.data)} days, latest fill level: "
+                f"{ds.data[max(ds.data)].get('fill_level_pct', 'N/A') if ds.data else None}%"),
+            'entsog_flows': ('gas_flows', lambda ds:
+                f"gas flows data: {len(ds.data)} days, latest net flow: "
+                f"{ds.data[max(ds.data)].get('net_flow_gwh', 'N/A') if ds.data else None} GWh"),
+        }
+
+        # NOTE: awaiting each result directly, so exceptions are NOT surfaced
+        # as values (the as_completed equivalent of gather without
+        # return_exceptions=True). BaseCollector.collect() traps internally and
+        # returns None on failure (see collectors/base.py). The downstream
+        # `if X_data:` truthiness checks rely on this — they would falsely pass
+        # for a non-None exception object. Don't start collecting exceptions
+        # without also adding explicit isinstance(_, BaseException) checks
+        # before the per-collector save blocks.
+        async def _save_eager(result, name, summary):
+            await asyncio.to_thread(save_feed, result, name, run_ts, handler, encryption)
+            # The summaries walk the dataset, so only build them if INFO is on
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info("Saved %s", summary(result))
+
+        results: dict[str, Any] = {}
+        # Eager saves run as tasks, so the encrypt + write of one feed
+        # overlaps with waiting on (and saving) the next collector's result.
+        eager_saves = []
+        http_session = None
+        try:
+            # One pooled session for the plain-aiohttp collectors (the buurt
+            # Luchtmeetnet instances all hit the same host). Open-Meteo collectors
+            # keep their own sessions on purpose — see collectors/_openmeteo_shared.py.
+            http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300)
+            )
+            for c in [epex_collector, entsog_flows_collector, *luchtmeetnet_buurt_collectors]:
+                c.session = http_session
+
+            for next_done in asyncio.as_completed([_labelled(k, c) for k, c in task_specs]):
+                key, result = await next_done
+                results[key] = result
+                if result and key in eager_feeds:
+                    eager_saves.append(asyncio.create_task(_save_eager(result, *eager_feeds[key])))
+            await asyncio.gather(*eager_saves)
+        finally:
+            # On an error above, don't leave eager saves running unobserved
+            unfinished = [task for task in eager_saves if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+            if http_session is not None:
+                await http_session.close()
 
         # Named extraction — no index accounting, no slice math.
         entsoe_data = results['entsoe_nl']
@@ -771,8 +950,9 @@ async def main() -> None:
                     today, tomorrow, country_code='DE_LU'
                 )
 
-            retry_results = await asyncio.gather(*retry_tasks.values())
-            for key, result in zip(retry_tasks.keys(), retry_results):
+            # Bounded like the first round: a hung retry must not stall the run
+            retry_results = await asyncio.gather(*(_labelled(k, c) for k, c in retry_tasks.items()))
+            for key, result in retry_results:
                 if result is not None:
                     logging.info(f"Retry succeeded for '{key}' on round {retry_round}")
                     if key == 'entsoe_nl':
@@ -786,34 +966,6 @@ async def main() -> None:
         combined_data.add_dataset('energy_zero', energy_zero_data)
         combined_data.add_dataset('epex', epex_data)
         combined_data.add_dataset('elspot', elspot_data)
-        if combined_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_energy_price_forecast.json")
-            save_data_file(data=combined_data, file_path=full_path, handler=handler, encrypt=encryption)
-            # if encryption:
-            #     encrypted_data = handler.encrypt_and_sign(combined_data.to_dict())
-            #     with open(full_path, 'w') as f:
-            #         f.write(encrypted_data)
-            # else:
-            #     combined_data.write_to_json(full_path)
-            shutil.copy(full_path, os.path.join(output_path, "energy_price_forecast.json"))
-            de_points = len(entsoe_de_data.data) if entsoe_de_data else 0
-            logging.info(f"Saved energy prices: NL + DE ({de_points} German price points)")
-
-        # Save strategic multi-location weather forecast (used by augur dashboard
-        # weather charts). Source switched from Google Weather to Open-Meteo on
-        # 2026-06-05; same filename + schema-compatible field names so augur sees
-        # no change beyond previously-dead charts populating.
-        if strategic_weather_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_weather_forecast_multi_location.json")
-            save_data_file(data=strategic_weather_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "weather_forecast_multi_location.json"))
-            logging.info(f"Saved multi-location weather forecast (Open-Meteo) for {len(all_weather_locations)} strategic CWE+DK locations")
-
-        if tennet_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_grid_imbalance.json")
-            save_data_file(data=tennet_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "grid_imbalance.json"))
-            logging.info(f"Saved TenneT grid imbalance data with {tennet_data.metadata.get('data_points', 0)} data points")
 
         # Wind forecast output - combines ENTSO-E generation forecasts with offshore wind weather data
         # This dedicated wind file is optimized for price prediction models
@@ -822,107 +974,18 @@ async def main() -> None:
         # Add ENTSO-E wind generation forecasts (MW by country)
         if entsoe_wind_data:
             wind_combined_data.add_dataset('entsoe_wind_generation', entsoe_wind_data)
-            logging.info(f"Added ENTSO-E wind generation forecasts for {len(entsoe_wind_data.data)} countries")
+            logging.info("Added ENTSO-E wind generation forecasts for %d countries", len(entsoe_wind_data.data))
 
         # Add Open-Meteo offshore wind data (actual offshore coordinates)
         # This provides wind speed at multiple heights (10m, 80m, 120m, 180m) plus air density
         if offshore_wind_data:
             wind_combined_data.add_dataset('offshore_wind', offshore_wind_data)
-            logging.info(f"Added Open-Meteo offshore wind data for {len(offshore_wind_data.data)} offshore locations")
-
-        # Save combined wind forecast
-        if wind_combined_data.datasets:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_wind_forecast.json")
-            save_data_file(data=wind_combined_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "wind_forecast.json"))
-            logging.info(f"Saved combined wind forecast with {len(wind_combined_data.datasets)} data sources")
-
-        # Save NED.nl energy production data (solar, wind onshore/offshore - NL actual + forecast)
-        if ned_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_ned_production.json")
-            save_data_file(data=ned_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "ned_production.json"))
-            energy_types = ned_data.metadata.get('energy_types', [])
-            logging.info(f"Saved NED.nl production data for {len(energy_types)} energy types: {energy_types}")
-
-        # Save solar irradiance forecast for supply prediction
-        if solar_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_solar_forecast.json")
-            save_data_file(data=solar_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "solar_forecast.json"))
-            logging.info(f"Saved solar irradiance forecast for {len(solar_locations)} locations")
-
-        # Save demand weather forecast for demand prediction (heating/cooling)
-        if demand_weather_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_demand_weather_forecast.json")
-            save_data_file(data=demand_weather_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "demand_weather_forecast.json"))
-            total_pop = sum(loc.get('population', 0) for loc in population_centers)
-            logging.info(f"Saved demand weather forecast for {len(population_centers)} population centers ({total_pop:,} total population)")
-
-        # Save buurt-level weather forecast (FyE B1 short-horizon use case).
-        # 16-day horizon, ~17 fields per timestamp; not consumed by augur.
-        if buurt_weather_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_weather_forecast_buurt.json")
-            save_data_file(data=buurt_weather_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "weather_forecast_buurt.json"))
-            logging.info(f"Saved buurt weather forecast for {len(buurt_locations)} neighbourhoods (FyE B1)")
-
-        # Save buurt-level solar irradiance forecast (FyE B1 buurt-PV use case).
-        # GHI/DNI/DHI per timestamp at Elsweide + Elderveld; 16-day horizon.
-        if buurt_solar_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_solar_forecast_buurt.json")
-            save_data_file(data=buurt_solar_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "solar_forecast_buurt.json"))
-            logging.info(f"Saved buurt solar irradiance forecast for {len(buurt_locations)} neighbourhoods (FyE B1)")
-
-        # Save buurt-level air quality (FyE B1 transdisciplinary signal).
+            logging.info("Added Open-Meteo offshore wind data for %d offshore locations", len(offshore_wind_data.data))
+
+        # Buurt-level air quality (FyE B1 transdisciplinary signal).
         # Envelope shape pinned by `assemble_buurt_air_envelope` to match
         # weather_forecast_buurt.json / solar_forecast_buurt.json — see #17.
         buurt_air_combined = assemble_buurt_air_envelope(buurt_locations, buurt_aq_data)
-        if buurt_air_combined is not None:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_air_quality_buurt.json")
-            save_data_file(data=buurt_air_combined, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "air_quality_buurt.json"))
-            logging.info(f"Saved buurt air quality (Luchtmeetnet) for {len(buurt_air_combined.data)} neighbourhoods (FyE B1)")
-
-        # Save cross-border flows data (import/export between NL and neighbors)
-        if flows_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_cross_border_flows.json")
-            save_data_file(data=flows_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "cross_border_flows.json"))
-            summary = flows_data.data.get('summary', {})
-            logging.info(f"Saved cross-border flows for {len(summary.get('borders', []))} borders, avg net: {summary.get('avg_net_position', 0)} MW")
-
-        # Save load forecast data (electricity demand predictions)
-        if load_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_load_forecast.json")
-            save_data_file(data=load_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "load_forecast.json"))
-            logging.info(f"Saved load forecast for {len(load_data.data)} countries")
-
-        # Save generation data (French nuclear availability)
-        if generation_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_generation_forecast.json")
-            save_data_file(data=generation_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "generation_forecast.json"))
-            logging.info(f"Saved generation data for {len(generation_data.data)} countries (nuclear availability)")
-
-        # Save Nordic hydro reservoir data (NO, SE - weekly cadence, ~2-3 week lag)
-        if hydro_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_nordic_hydro.json")
-            save_data_file(data=hydro_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "nordic_hydro.json"))
-            zones = list(hydro_data.data.keys()) if hydro_data.data else []
-            logging.info(f"Saved Nordic hydro reservoirs for {len(zones)} zones: {zones}")
-
-        # Save generation mix data (NL, DE, BE - all fuel types)
-        if genmix_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_generation_mix.json")
-            save_data_file(data=genmix_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "generation_mix.json"))
-            countries = list(genmix_data.data.keys()) if genmix_data.data else []
-            logging.info(f"Saved generation mix for {len(countries)} countries: {countries}")
 
         # Generate calendar features for the forecast period
         # Calendar features affect electricity demand (holidays, weekends, season)
@@ -942,20 +1005,6 @@ async def main() -> None:
             data=calendar_data
         )
 
-        full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_calendar_features.json")
-        save_data_file(data=calendar_dataset, file_path=full_path, handler=handler, encrypt=encryption)
-        shutil.copy(full_path, os.path.join(output_path, "calendar_features.json"))
-        logging.info(f"Saved calendar features for {len(calendar_data)} hours, {len(upcoming_holidays)} upcoming holidays")
-
-        # Save market proxy data (carbon and gas prices)
-        if market_proxy_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_market_proxies.json")
-            save_data_file(data=market_proxy_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "market_proxies.json"))
-            carbon_price = market_proxy_data.data.get('carbon', {}).get('price', 'N/A')
-            gas_price = market_proxy_data.data.get('gas', {}).get('price', 'N/A')
-            logging.info(f"Saved market proxies: carbon=${carbon_price}, gas=${gas_price}")
-
         # --- Accumulate market history time series ---
         market_history_dataset = None
         # Build a rolling 180-day time series of daily gas TTF and carbon EUA prices
@@ -1020,7 +1069,6 @@ async def main() -> None:
                     if d >= cutoff_date
                 }
 
-        # Save accumulated history
         if existing_history and any(
             existing_history.get(k, {}).get('data') for k in ['gas_ttf', 'carbon_eua']
         ):
@@ -1035,36 +1083,58 @@ async def main() -> None:
                 },
                 data=existing_history
             )
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_market_history.json")
-            save_data_file(data=market_history_dataset, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, market_history_file)
-            ttf_points = len(existing_history.get('gas_ttf', {}).get('data', {}))
-            carbon_points = len(existing_history.get('carbon_eua', {}).get('data', {}))
-            logging.info(f"Saved market history: TTF={ttf_points} days, carbon={carbon_points} days")
-
-        # Save GIE gas storage data (fill levels, injection/withdrawal)
-        if gie_storage_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_gas_storage.json")
-            save_data_file(data=gie_storage_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "gas_storage.json"))
-            # Get latest fill level for logging
-            latest_fill = None
-            if gie_storage_data.data:
-                latest_ts = max(gie_storage_data.data.keys())
-                latest_fill = gie_storage_data.data[latest_ts].get('fill_level_pct', 'N/A')
-            logging.info(f"Saved gas storage data: {len(gie_storage_data.data)} days, latest fill level: {latest_fill}%")
-
-        # Save ENTSOG gas flows data (entry/exit flows)
-        if entsog_flows_data:
-            full_path = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}_gas_flows.json")
-            save_data_file(data=entsog_flows_data, file_path=full_path, handler=handler, encrypt=encryption)
-            shutil.copy(full_path, os.path.join(output_path, "gas_flows.json"))
-            # Get latest net flow for logging
-            latest_net = None
-            if entsog_flows_data.data:
-                latest_ts = max(entsog_flows_data.data.keys())
-                latest_net = entsog_flows_data.data[latest_ts].get('net_flow_gwh', 'N/A')
-            logging.info(f"Saved gas flows data: {len(entsog_flows_data.data)} days, latest net flow: {latest_net} GWh")
+
+        # --- Save the batch-dependent feeds ---
+        # One row per output: (file stem, dataset — falsy when there is nothing
+        # to publish, log format, log args). Rows are written concurrently,
+        # each encrypt + write in a worker thread.
+        #  - energy_price_forecast / wind_forecast: a CombinedDataSet is falsy
+        #    when none of its sources returned data, so a run where every
+        #    price API was down doesn't overwrite the last good file.
+        #  - weather_forecast_multi_location: used by augur dashboard weather
+        #    charts. Source switched from Google Weather to Open-Meteo on
+        #    2026-06-05; same filename + schema-compatible field names so augur
+        #    sees no change beyond previously-dead charts populating.
+        #  - weather_forecast_buurt: FyE B1 short-horizon use case. 16-day
+        #    horizon, ~17 fields per timestamp; not consumed by augur.
+        #  - solar_forecast_buurt: FyE B1 buurt-PV use case. GHI/DNI/DHI per
+        #    timestamp at Elsweide + Elderveld; 16-day horizon.
+        de_points = len(entsoe_de_data.data) if entsoe_de_data else 0
+        save_specs = [
+            ('energy_price_forecast', combined_data,
+             "Saved energy prices: NL + DE (%d German price points)", (de_points,)),
+            ('weather_forecast_multi_location', strategic_weather_data,
+             "Saved multi-location weather forecast (Open-Meteo) for %d strategic CWE+DK locations",
+             (len(all_weather_locations),)),
+            ('wind_forecast', wind_combined_data,
+             "Saved combined wind forecast with %d data sources", (len(wind_combined_data.datasets),)),
+            ('solar_forecast', solar_data,
+             "Saved solar irradiance forecast for %d locations", (len(solar_locations),)),
+            ('demand_weather_forecast', demand_weather_data,
+             "Saved demand weather forecast for %d population centers (%s total population)",
+             (len(POPULATION_CENTERS), f"{TOTAL_POPULATION:,}")),
+            ('weather_forecast_buurt', buurt_weather_data,
+             "Saved buurt weather forecast for %d neighbourhoods (FyE B1)", (len(buurt_locations),)),
+            ('solar_forecast_buurt', buurt_solar_data,
+             "Saved buurt solar irradiance forecast for %d neighbourhoods (FyE B1)", (len(buurt_locations),)),
+            ('air_quality_buurt', buurt_air_combined,
+             "Saved buurt air quality (Luchtmeetnet) for %d neighbourhoods (FyE B1)",
+             (len(buurt_air_combined.data) if buurt_air_combined else 0,)),
+            ('calendar_features', calendar_dataset,
+             "Saved calendar features for %d hours, %d upcoming holidays",
+             (len(calendar_data), len(upcoming_holidays))),
+            ('market_history', market_history_dataset,
+             "Saved market history: TTF=%d days, carbon=%d days",
+             (len(existing_history.get('gas_ttf', {}).get('data', {})),
+              len(existing_history.get('carbon_eua', {}).get('data', {})))),
+        ]
+        save_specs = [spec for spec in save_specs if spec[1]]
+        await asyncio.gather(*(
+            asyncio.to_thread(save_feed, dataset, name, run_ts, handler, encryption)
+            for name, dataset, _, _ in save_specs
+        ))
+        for _, _, log_format, log_args in save_specs:
+            logging.info(log_format, *log_args)
 
         # --- Shape-drift sidecar (#27 Layer A) ---
         # Capture a structural fingerprint of every published feed BEFORE
@@ -1074,9 +1144,9 @@ async def main() -> None:
         # bump — preventing the silent failure mode behind PR #20 and #26.
         # Keys mirror the canonical filenames published to docs/.
         published_feeds: Dict[str, Any] = {}
-        if combined_data and combined_data.datasets:
+        if combined_data:
             published_feeds['energy_price_forecast.json'] = combined_data.to_dict()
-        if wind_combined_data and wind_combined_data.datasets:
+        if wind_combined_data:
             published_feeds['wind_forecast.json'] = wind_combined_data.to_dict()
         if buurt_air_combined is not None:
             published_feeds['air_quality_buurt.json'] = buurt_air_combined.to_dict()
@@ -1106,27 +1176,13 @@ async def main() -> None:
         sidecar = signatures_for_published_feeds(
             published_feeds, schema_version=CURRENT_SCHEMA_VERSION
         )
+        # Written on a worker thread while the quality checks below run;
+        # awaited together with the quality report.
         sidecar_path = os.path.join(output_path, "_shape_signatures.json")
-        with open(sidecar_path, 'w') as f:
-            json.dump(sidecar, f, indent=2)
-        logging.info(
-            f"Shape-signature sidecar written: {len(sidecar['feeds'])} feeds, "
-            f"schema_version={CURRENT_SCHEMA_VERSION} → {sidecar_path}"
-        )
-
-        # #43: the learning record. The sidecar above is the drift tripwire's
-        # BASELINE and must only advance on a passing run; this is the HISTORY
-        # the volatility classifier learns from and must record every run,
-        # including ones the tripwire fails. Keeping both roles in one file
-        # meant a failing run taught the classifier nothing, so a transient that
-        # tripped the gate would trip it again forever.
         observations_path = os.path.join(output_path, OBSERVATIONS_FILENAME)
-        try:
-            append_shape_observation(observations_path, sidecar)
-            logging.info(f"Shape observation appended → {observations_path}")
-        except OSError as e:
-            # Never fail a collection over the learning record.
-            logging.warning(f"Could not append shape observation: {e}")
+        shape_records_written = asyncio.create_task(asyncio.to_thread(
+            _write_shape_records, sidecar, sidecar_path, observations_path
+        ))
 
         # --- Data Quality Report ---
         # Run FMEA-based quality checks on all collected datasets
@@ -1192,8 +1248,7 @@ async def main() -> None:
         streaks.update(update_upstream_empty_streaks(
             prior_streaks, present_empty_datasets, PRESENT_EMPTY_GRACE_FEEDS
         ))
-        with open(streak_path, 'w') as f:
-            json.dump(streaks, f, indent=2)
+        _write_json_file(streak_path, streaks)
         escalated = escalated_upstream_feeds(streaks)
         if escalated:
             logging.error(
@@ -1210,8 +1265,10 @@ async def main() -> None:
             quality_datasets, upstream_empty=report_upstream_empty
         )
         quality_report_path = os.path.join(output_path, "data_quality_report.json")
-        with open(quality_report_path, 'w') as f:
-            json.dump(quality_report.to_dict(), f, indent=2)
+        await asyncio.gather(
+            shape_records_written,
+            asyncio.to_thread(_write_json_file, quality_report_path, quality_report.to_dict()),
+        )
         logging.info(f"Data quality report: status={quality_report.status}, "
                      f"issues={quality_report.total_issues}, "
                      f"saved to {quality_report_path}")
@@ -1259,5 +1316,7 @@ if __name__ == "__main__":
     # Set appropriate event loop policy for Windows
     if platform.system() == 'Windows':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())        
+    elif uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     asyncio.run(main())
\ No newline at end of file
@@ -47,7 +47,7 @@ import asyncio
 from datetime import datetime, timedelta
 import logging
 from energyzero import EnergyZero, VatOption
-from utils.timezone_helpers import ensure_timezone
+from utils.timezone_helpers import ensure_timezone, fixed_offset_for_window
 from utils.data_types import EnhancedDataSet
 import platform
 
@@ -69,6 +69,7 @@ async def get_Energy_zero_data(start_time: datetime, end_time: datetime) -> Enha
             raise ValueError("End time must be provided")
         
         start_time, end_time, timezone = ensure_timezone(start_time, end_time)
+        output_tz = fixed_offset_for_window(timezone, start_time, end_time)
 
         logging.info(f"Querying EnergyZero API from {start_time} to {end_time}")
 
@@ -83,15 +84,18 @@ async def get_Energy_zero_data(start_time: datetime, end_time: datetime) -> Enha
                     'units': 'EUR/kWh (incl. VAT)',
                     'start_time': start_time.isoformat(),
                     'end_time': end_time.isoformat()},        
-                data = {timestamp.astimezone(timezone).isoformat(): price for timestamp, price in data.prices.items() if start_time <= timestamp < end_time}
+                data = {timestamp.astimezone(output_tz).isoformat(): price for timestamp, price in data.prices.items() if start_time <= timestamp < end_time}
             )
 
             if dataset.data:
-                now_hour = list(dataset['data'].keys())[0]
-                next_hour = list(dataset['data'].keys())[1]
-                logging.info(f"EnergyZero day ahead price from: {start_time} to {end_time}\n"
-                            f"Current: {dataset['data'][now_hour]} EUR/MWh @ now_hour\n" 
-                            f"Next hour: {dataset['data'][next_hour]} EUR/MWh @ next_hour")
+                hours = iter(dataset['data'])
+                now_hour = next(hours)
+                next_hour = next(hours, None)
+                message = (f"EnergyZero day ahead price from: {start_time} to {end_time}\n"
+                           f"Current: {dataset['data'][now_hour]} EUR/MWh @ now_hour")
+                if next_hour is not None:
+                    message += f"\nNext hour: {dataset['data'][next_hour]} EUR/MWh @ next_hour"
+                logging.info(message)
             else:
                 logging.warning(f"No data retrieved for the specified time range: {start_time} to {end_time}")            
 
@@ -45,13 +45,22 @@ Notes:
     - All timestamps are handled in UTC and converted as needed
 """
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import pandas as pd
 from entsoe import EntsoePandasClient
 import logging
-from functools import partial
+from functools import lru_cache, partial
 from utils.data_types import EnhancedDataSet
 
+# Blocking entsoe-py calls run on their own small warm pool
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='entsoe')
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> EntsoePandasClient:
+    """One client (and so one keep-alive requests.Session) per API key, reused across calls."""
+    return EntsoePandasClient(api_key=api_key)
+
 async def get_Entsoe_data(api_key: str, country_code: str, start_time: datetime, end_time: datetime) -> EnhancedDataSet:
     """
     Retrieves day-ahead energy price data from Entsoe API for a specified time range.
@@ -77,7 +86,7 @@ async def get_Entsoe_data(api_key: str, country_code: str, start_time: datetime,
 
         logging.info(f"Querying Entsoe API for {country_code} from {start_timestamp} to {end_timestamp}")
 
-        client = EntsoePandasClient(api_key=api_key)
+        client = _get_client(api_key)
 
         # Use partial to create a function with keyword arguments
         query_func = partial(client.query_day_ahead_prices, 
@@ -87,7 +96,7 @@ async def get_Entsoe_data(api_key: str, country_code: str, start_time: datetime,
 
         # EntsoePandasClient is not async, so we run it in a separate thread
         loop = asyncio.get_running_loop()
-        data = await loop.run_in_executor(None, query_func)
+        data = await loop.run_in_executor(_EXECUTOR, query_func)
 
         dataset = EnhancedDataSet(
             metadata={
@@ -101,11 +110,14 @@ async def get_Entsoe_data(api_key: str, country_code: str, start_time: datetime,
         )
 
         if dataset.data:
-            now_hour = list(dataset['data'].keys())[0]
-            next_hour = list(dataset['data'].keys())[1]
-            logging.info(f"Entsoe day ahead price from: {start_timestamp} to {end_timestamp}\n"
-                         f"Current: {dataset['data'][now_hour]} EUR/MWh @ now_hour\n" 
-                         f"Next hour: {dataset['data'][next_hour]} EUR/MWh @ next_hour")
+            hours = iter(dataset['data'])
+            now_hour = next(hours)
+            next_hour = next(hours, None)
+            message = (f"Entsoe day ahead price from: {start_timestamp} to {end_timestamp}\n"
+                       f"Current: {dataset['data'][now_hour]} EUR/MWh @ now_hour")
+            if next_hour is not None:
+                message += f"\nNext hour: {dataset['data'][next_hour]} EUR/MWh @ next_hour"
+            logging.info(message)
         else:
             logging.warning(f"No data retrieved for the specified time range: {start_time} to {end_time}")            
 
@@ -47,8 +47,9 @@ import aiohttp
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from utils.timezone_helpers import ensure_timezone
+from utils.timezone_helpers import ensure_timezone, fixed_offset_for_window
 from utils.data_types import EnhancedDataSet
+from utils.helpers import loads_json
 
 async def get_Epex_data(start_time: datetime, end_time: datetime) -> EnhancedDataSet:
     """
@@ -69,6 +70,7 @@ async def get_Epex_data(start_time: datetime, end_time: datetime) -> EnhancedDat
         raise ValueError("End time must be provided")
 
     start_time, end_time, tz = ensure_timezone(start_time, end_time)
+    output_tz = fixed_offset_for_window(tz, start_time, end_time)
 
     logging.info(f"Querying Epex API from {start_time} to {end_time}")
 
@@ -84,7 +86,7 @@ async def get_Epex_data(start_time: datetime, end_time: datetime) -> EnhancedDat
                 logging.error(f"Unable to fetch data. Status code: {response.status}")
                 return None
 
-            data = await response.json()            
+            data = await response.json(loads=loads_json)
 
             dataset = EnhancedDataSet(
                 metadata={
@@ -94,15 +96,18 @@ async def get_Epex_data(start_time: datetime, end_time: datetime) -> EnhancedDat
                     'units': 'EUR/MWh',
                     'start_time': start_time.isoformat(),
                     'end_time': end_time.isoformat()},        
-                data = {datetime.fromtimestamp(item['start_timestamp'] / 1000, tz=tz).isoformat(): item['marketprice'] for item in data['data']}
+                data = {datetime.fromtimestamp(item['start_timestamp'] / 1000, tz=output_tz).isoformat(): item['marketprice'] for item in data['data']}
             )
 
             if dataset.data:
-                now_hour = list(dataset['data'].keys())[0]
-                next_hour = list(dataset['data'].keys())[1]
-                logging.info(f"EnergyZero day ahead price from: {start_time} to {end_time}\n"
-                            f"Current: {dataset['data'][now_hour]} EUR/MWh @ now_hour\n" 
-                            f"Next hour: {dataset['data'][next_hour]} EUR/MWh @ next_hour")
+                hours = iter(dataset['data'])
+                now_hour = next(hours)
+                next_hour = next(hours, None)
+                message = (f"EnergyZero day ahead price from: {start_time} to {end_time}\n"
+                           f"Current: {dataset['data'][now_hour]} EUR/MWh @ now_hour")
+                if next_hour is not None:
+                    message += f"\nNext hour: {dataset['data'][next_hour]} EUR/MWh @ next_hour"
+                logging.info(message)
             else:
                 logging.warning(f"No data retrieved for the specified time range: {start_time} to {end_time}")            
 
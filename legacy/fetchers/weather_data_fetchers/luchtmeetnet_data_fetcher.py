@@ -168,7 +168,7 @@ async def get_luchtmeetnet_data(latitude: float, longitude: float, start_time: d
             )
 
             if dataset.data:
-                now_hour = list(dataset['data'].keys())[0]
+                now_hour = next(iter(dataset['data']))
                 logging.info(f"Luchtmeetnet data from {start_time} to {end_time}\n"
                             f"Current: {dataset['data'][now_hour]}\n")
             else:
@@ -146,11 +146,14 @@ async def get_MeteoServer_sun_forecast(api_key: str, latitude: float, longitude:
                     )
 
                     if dataset.data:
-                        now_hour = list(dataset['data'].keys())[0]
-                        next_hour = list(dataset['data'].keys())[1]
-                        logging.info(f"OpenWeather forecast from {start_time} to {end_time}\n"
-                                    f"Current: {dataset['data'][now_hour]}\n"
-                                    f"Next hour: {dataset['data'][next_hour]}")
+                        hours = iter(dataset['data'])
+                        now_hour = next(hours)
+                        next_hour = next(hours, None)
+                        message = (f"OpenWeather forecast from {start_time} to {end_time}\n"
+                                   f"Current: {dataset['data'][now_hour]}")
+                        if next_hour is not None:
+                            message += f"\nNext hour: {dataset['data'][next_hour]}"
+                        logging.info(message)
                     else:
                         logging.warning(f"No data retrieved for the specified time range: {start_time} to {end_time}")
                     return dataset
@@ -260,11 +263,14 @@ async def get_MeteoServer_weather_forecast_data(api_key: str, latitude: float, l
                     )
 
                     if dataset.data:
-                        now_hour = list(dataset['data'].keys())[0]
-                        next_hour = list(dataset['data'].keys())[1]
-                        logging.info(f"MeteoServer forecast from {start_time} to {end_time}\n"
-                                    f"Current: {dataset['data'][now_hour]}\n"
-                                    f"Next hour: {dataset['data'][next_hour]}")
+                        hours = iter(dataset['data'])
+                        now_hour = next(hours)
+                        next_hour = next(hours, None)
+                        message = (f"MeteoServer forecast from {start_time} to {end_time}\n"
+                                   f"Current: {dataset['data'][now_hour]}")
+                        if next_hour is not None:
+                            message += f"\nNext hour: {dataset['data'][next_hour]}"
+                        logging.info(message)
                     else:
                         logging.warning(f"No data retrieved for the specified time range: {start_time} to {end_time}")
                     return dataset
@@ -1,17 +1,30 @@
 import os
 from datetime import datetime, date, timedelta, timezone
-import json
 import subprocess
 import asyncio
+import functools
 import logging
 from energyzero import EnergyZero, VatOption
-import pytz
+from zoneinfo import ZoneInfo
 from entsoe import EntsoePandasClient
 import pandas as pd
 from configparser import ConfigParser 
-import requests
+import aiohttp
 import meteoserver as meteo
 import shutil
+from utils.helpers import dumps_json, loads_json
+try:
+    import zstandard  # optional: adds a compressed copy of each latest file
+except ImportError:
+    zstandard = None
+try:
+    import uvloop  # optional: faster event loop for the concurrent fetches
+except ImportError:
+    uvloop = None
+try:
+    import pyarrow  # optional: enables the Parquet copies of the forecast tables
+except ImportError:
+    pyarrow = None
 
 # run this from cron, e.g. hourly, e.g.
 # 0 * * * * /home/pi/energyDataHub/run_script.sh >> /home/pi/tmp/local_data_fetcher.py.log 2>&1
@@ -39,19 +52,73 @@ try:
 except OSError as e:
     print(f"Error creating folder: {e}")
 
-file_list = [f for f in os.listdir(output_path) if f.endswith(".json")]
+# the previous run's outputs (JSON and their Parquet copies) are already synced
+file_list = [f for f in os.listdir(output_path) if f.endswith((".json", ".parquet"))]
 for f in file_list:
     os.remove(os.path.join(output_path, f))
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s %(levelname)s %(message)s',
-    handlers=[logging.StreamHandler(), logging.FileHandler(os.path.join(output_path, LOGGING_FILE_NAME))]
-    )
-
-local_timezone = pytz.timezone("CET")
+local_timezone = ZoneInfo("Europe/Amsterdam")
+TIMEZONE_TAG = "CET"  # file name suffix and metadata "data_timezone", kept stable for existing consumers
 country_code = 'NL'
 
+def publish_latest(src, dst):
+    """Point the "latest" alias dst at src via a hardlink; copy if linking is unsupported.
+
+    Both dst and its .zst copy are built under a temporary name and renamed
+    into place, so a client downloading them never sees a missing or
+    half-written file.
+
+    Returns the paths written (dst, plus its .zst copy when made).
+    """
+    tmp = dst + '.tmp'
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+    # renaming a link over another link to the same file is a no-op, so skip that case
+    if not (os.path.exists(dst) and os.path.samefile(src, dst)):
+        try:
+            os.link(src, tmp)
+        except OSError:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    # JSON compresses several-fold; the .zst copy is what's worth syncing remotely
+    if zstandard is not None:
+        with open(src, 'rb') as f_in, open(tmp, 'wb') as f_out:
+            zstandard.ZstdCompressor(level=3).copy_stream(f_in, f_out)
+        os.replace(tmp, dst + '.zst')
+        return [dst, dst + '.zst']
+    return [dst]
+
+def dump_with_records(fp, json_data, key, df):
+    """Write json_data to the binary file fp with df's rows under key as records.
+
+    The rows are serialized by DataFrame.to_json (C) and parsed back, instead
+    of going through to_dict(orient='records'), which builds each row via
+    pandas' Python-level boxing. Datetime columns keep the "YYYY-MM-DD HH:MM:SS"
+    text that str() gave them; missing values (NaN/NaT) are written as null.
+    """
+    datetime_columns = df.select_dtypes(include=['datetime', 'datetimetz']).columns
+    if len(datetime_columns):
+        df = df.assign(**{column: df[column].map(str).where(df[column].notna(), None)
+                          for column in datetime_columns})
+    records = df.to_json(orient='records', force_ascii=False, double_precision=15, default_handler=str)
+    fp.write(dumps_json({**json_data, key: loads_json(records)}, indent=True))
+
+def write_parquet(df, json_file_name):
+    """Write df as Parquet next to json_file_name, for cheap read-back into pandas.
+
+    Returns the paths written; empty when pyarrow is missing or the frame
+    can't be converted (the JSON file stays the primary output).
+    """
+    if pyarrow is None:
+        return []
+    parquet_file_name = os.path.splitext(json_file_name)[0] + '.parquet'
+    try:
+        df.to_parquet(parquet_file_name, engine='pyarrow', compression='zstd', index=False)
+    except (ValueError, TypeError) as e:
+        logging.warning(f"Could not write {parquet_file_name}: {e}")
+        return []
+    return [parquet_file_name]
+
 # logging.basicConfig(
 #     level=logging.DEBUG,
 #     format='%(asctime)s %(levelname)s %(message)s',
@@ -72,7 +139,6 @@ async def get_energy_zero_data() -> dict:
    
             electricity = await client.energy_prices(start_date=today, end_date=tomorrow)
             next_hour = electricity.utcnow() + timedelta(hours=1)
-            gas = await client.gas_prices(start_date=today, end_date=tomorrow)
 
             logging.info(f"Energy zero electricity price, "
                          f"Current: {electricity.current_price} EUR/kWh @ {electricity.utcnow().astimezone(local_timezone)}, " 
@@ -108,10 +174,10 @@ async def get_Entsoe_data(api_key:str) -> dict:
         tomorrow = current_time  + timedelta(days = 1)
         tomorrow_midnight = tomorrow.replace(hour=23, minute=0, second=0, microsecond=0)
         end_timestamp = pd.Timestamp(tomorrow_midnight, tz='UTC')
-        ts = client.query_day_ahead_prices(country_code, start=current_start_timestamp, end=end_timestamp)
-        data_dict = ts.to_dict() # { ts.inde for ts.index in ts.values}
-        formatted_keys = [t.strftime('%Y-%m-%dT%H:%M:%S+02:00') for t in data_dict.keys()]
-        data = dict(zip(formatted_keys, data_dict.values()))
+        # blocking HTTP client: run it on a worker thread so other fetches overlap
+        ts = await asyncio.to_thread(client.query_day_ahead_prices, country_code, start=current_start_timestamp, end=end_timestamp)
+        # one dict, keyed by local ISO timestamps with the real (DST-aware) offset
+        data = dict(zip((t.isoformat() for t in ts.index.tz_convert(local_timezone)), ts.values.tolist()))
 
         # Other interesting data from Entsoe API:
         # ts = client.query_wind_and_solar_forecast(country_code, start=today, end=tomorrow)
@@ -121,12 +187,17 @@ async def get_Entsoe_data(api_key:str) -> dict:
         # query_activated_balancing_energy_prices, query_imbalance_prices, query_imbalance_volumes,
         # query_procured_balancing_capacity, query_activated_balancing_energy
 
-        now_hour = list(data.keys())[0]
-        next_hour = list(data.keys())[1]
-        
-        logging.info(f"Entsoe day ahead price from: {start_timestamp} to {end_timestamp}\n"
-                     f"Current: {data[now_hour]} EUR/MWh @ {now_hour}\n" 
-                     f"Next hour: {data[next_hour]} EUR/MWh @ {next_hour}")
+        if data:
+            hours = iter(data)
+            now_hour = next(hours)
+            next_hour = next(hours, None)
+            message = (f"Entsoe day ahead price from: {start_timestamp} to {end_timestamp}\n"
+                       f"Current: {data[now_hour]} EUR/MWh @ {now_hour}")
+            if next_hour is not None:
+                message += f"\nNext hour: {data[next_hour]} EUR/MWh @ {next_hour}"
+            logging.info(message)
+        else:
+            logging.warning(f"No Entsoe data retrieved for {start_timestamp} to {end_timestamp}")
 
         return data
 
@@ -176,7 +247,48 @@ async def get_Epex_spot_data() -> dict:
         logging.error(f"Error retrieving Entsoe data: {e}")     
         return None    
     
-async def get_OpenWeather_data(api_key:str, latitude:str, longitude:str) -> dict:
+def async_retry(tries:int=3, backoff:float=1.5, exceptions:tuple=(aiohttp.ClientError, asyncio.TimeoutError)):
+    """
+    Retries an async function on the given exceptions, sleeping backoff**attempt seconds in between.
+
+    The last failure is re-raised, so callers keep their own error handling.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(tries):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as e:
+                    if attempt == tries - 1:
+                        raise
+                    delay = backoff ** attempt
+                    logging.warning(f"{func.__name__} failed ({e!r}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+        return wrapper
+    return decorator
+
+@async_retry()
+async def http_get_json(url:str, session:aiohttp.ClientSession=None) -> tuple:
+    """
+    GETs url without blocking the event loop; connection errors and timeouts are retried.
+
+    Args:
+        url (str): The URL to fetch.
+        session (aiohttp.ClientSession, optional): Shared session; a one-off session is used if None.
+
+    Returns:
+        tuple: (HTTP status, parsed JSON body or None when the status is not 200).
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await http_get_json.__wrapped__(url, session)  # this call is already retried
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+        if response.status != 200:
+            return response.status, None
+        return response.status, await response.json(loads=loads_json)
+
+async def get_OpenWeather_data(api_key:str, latitude:str, longitude:str, session:aiohttp.ClientSession=None) -> dict:
     """
     Retrieves weather data from the OpenWeather API based on the configured latitude and longitude.
 
@@ -184,6 +296,7 @@ async def get_OpenWeather_data(api_key:str, latitude:str, longitude:str) -> dict
         api_key (str): The OpenWeather API key.
         latitude (str): The latitude of the location (-90; 90).
         longitude (str): The longitude of the location (-180; 180).
+        session (aiohttp.ClientSession, optional): Shared HTTP session.
 
     Returns:
         A dictionary containing the following weather data:
@@ -199,9 +312,8 @@ async def get_OpenWeather_data(api_key:str, latitude:str, longitude:str) -> dict
     """
     try:
         url = f"https://api.openweathermap.org/data/2.5/weather?lat={latitude}&lon={longitude}&appid={api_key}"
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
+        status, data = await http_get_json(url, session)
+        if status == 200:
             # print(json.dumps(data, indent=4))
             weather_data = {
                 "temperature": data["main"]["temp"],
@@ -216,12 +328,12 @@ async def get_OpenWeather_data(api_key:str, latitude:str, longitude:str) -> dict
             }
             return weather_data
         else:
-            Exception(f"Error retrieving OpenWeather data: {response.status_code}")
+            Exception(f"Error retrieving OpenWeather data: {status}")
     except Exception as e:
         logging.error(f"Error retrieving OpenWeather data: {e}")     
         return None
     
-async def get_OpenWeather_geographical_coordinates_in_NL(api_key:str, plaats:str) -> dict:
+async def get_OpenWeather_geographical_coordinates_in_NL(api_key:str, plaats:str, session:aiohttp.ClientSession=None) -> dict:
     """
     Retrieves the geographical coordinates (latitude and longitude) of a specified location in the Netherlands
     using the OpenWeather API.
@@ -229,6 +341,7 @@ async def get_OpenWeather_geographical_coordinates_in_NL(api_key:str, plaats:str
     Args:
         api_key (str): The API key for accessing the OpenWeather API.
         plaats (str): The name of the location in the Netherlands.
+        session (aiohttp.ClientSession, optional): Shared session; a one-off session is used if None.
 
     Returns:
         dict: A dictionary containing the latitude and longitude of the specified location.
@@ -238,25 +351,64 @@ async def get_OpenWeather_geographical_coordinates_in_NL(api_key:str, plaats:str
 
     """
     url = f"http://api.openweathermap.org/geo/1.0/direct?q={plaats},?,NL&limit=1&appid={api_key}"
-    response = requests.get(url)
+    status, data = await http_get_json(url, session)
 
     try:
-        if response.status_code == 200:
-            data = response.json()
+        if status == 200:
             # print(json.dumps(data, indent=4))
             latitude = data[0]["lat"]
             longitude = data[0]["lon"]
             logging.info(f"OpenWeather geographical coordinates for {plaats}: {latitude}, {longitude}")
             return {"latitude": latitude, "longitude": longitude}
         else:
-            Exception(f"Error retrieving OpenWeather data: {response.status_code}") 
+            Exception(f"Error retrieving OpenWeather data: {status}") 
     except Exception as e:
         logging.error(f"Error retrieving OpenWeather data: {e}")     
         return None
 
 
+async def get_OpenWeather_data_for_plaats(api_key:str, plaats:str, session:aiohttp.ClientSession) -> dict:
+    """
+    Looks up the coordinates of plaats and retrieves the OpenWeather data there, over one session.
+    """
+    location = await get_OpenWeather_geographical_coordinates_in_NL(api_key=api_key, plaats=plaats, session=session)
+    return await get_OpenWeather_data(api_key=api_key, latitude=location['latitude'], longitude=location['longitude'], session=session)
+
+async def fetch_all(entsoe_api_key:str, openweather_api_key:str, meteoserver_api_key:str, plaats:str) -> list:
+    """
+    Fetches all data sources concurrently, so a run takes as long as the slowest source.
+    The whole run shares one event loop and one connection pool, the geocoding lookup included.
+
+    Returns:
+        list: [energy zero, entsoe, open weather, meteoserver weather forecast, meteoserver sun data],
+        with None for a source that failed.
+    """
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=20, limit_per_host=4, keepalive_timeout=60, ttl_dns_cache=300)) as session:
+        results = await asyncio.gather(
+            get_energy_zero_data(),
+            get_Entsoe_data(api_key=entsoe_api_key),
+            get_OpenWeather_data_for_plaats(api_key=openweather_api_key, plaats=plaats, session=session),
+            # the meteoserver package is synchronous, so run it on worker threads
+            asyncio.to_thread(meteo.read_json_url_weatherforecast, meteoserver_api_key, plaats, model='HARMONIE'),  # Option 1: HARMONIE/HiRLAM
+            asyncio.to_thread(meteo.read_json_url_sunData, meteoserver_api_key, plaats, loc=True, numeric=False),
+            return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            logging.error(f"Error retrieving data: {result}")
+    return [None if isinstance(result, BaseException) else result for result in results]
+
 
 if __name__ == "__main__":
+    # configured here, not at import; with delay=True the log file is only
+    # opened on the first record, and a host that set up logging keeps its own
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format='%(asctime)s %(levelname)s %(message)s',
+            handlers=[logging.StreamHandler(), logging.FileHandler(os.path.join(output_path, LOGGING_FILE_NAME), delay=True)]
+            )
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     secrets_file = os.path.join(script_dir, 'secrets.ini')
 # get the api keys and location from the secrets.ini file
     configur = ConfigParser() 
@@ -265,20 +417,25 @@ if __name__ == "__main__":
     openweather_api_key = configur.get('api_keys', 'openweather')
     meteoserver_api_key = configur.get('api_keys', 'meteo')
     plaats = configur.get('location', 'plaats')
-# get the geographical coordinates of the location
-    location = asyncio.run(get_OpenWeather_geographical_coordinates_in_NL(api_key=openweather_api_key, plaats=plaats))
-    latitude = location['latitude']
-    longitude = location['longitude']
 # get the data
-    energy_zero_data = asyncio.run(get_energy_zero_data())
-    energy_zero_data = {key.astimezone(local_timezone).isoformat(): value for key, value in energy_zero_data.prices.items()}
+    energy_zero_data, entsoe_data, weather_data, weather_forecast, sun_data = asyncio.run(
+        fetch_all(entsoe_api_key, openweather_api_key, meteoserver_api_key, plaats))
     current_time = datetime.now(local_timezone)
     current_hour_start = current_time.replace(minute=0, second=0, microsecond=0)
-    energy_zero_data = {key: value for key, value in energy_zero_data.items() if datetime.fromisoformat(key) >= current_hour_start}
-    entsoe_data = asyncio.run(get_Entsoe_data(api_key=entsoe_api_key))
-    weather_data = asyncio.run(get_OpenWeather_data(api_key=openweather_api_key, latitude=latitude, longitude=longitude))
+    # a failed source is None; the other sources are still written
+    if energy_zero_data is not None:
+        # convert and filter the whole index at once, so nothing is parsed back;
+        # isoformat (not strftime %z) keeps the +01:00 offset style of the other sources
+        prices = energy_zero_data.prices
+        ez_index = pd.DatetimeIndex(list(prices.keys())).tz_convert(local_timezone)
+        ez_mask = ez_index >= current_hour_start
+        ez_values = pd.Series(list(prices.values()), dtype=object)[ez_mask]
+        energy_zero_data = dict(zip((t.isoformat() for t in ez_index[ez_mask]), ez_values.tolist()))
+# one timestamp prefix shared by every file written in this run
+    run_tag = current_time.strftime('%y%m%d_%H%M%S')
+    run_files = []  # everything written this run, for the remote sync
 # write the data to a json file
-    json_file_name = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}{local_timezone}_energy_price_forecast.json")
+    json_file_name = os.path.join(output_path, f"{run_tag}{TIMEZONE_TAG}_energy_price_forecast.json")
     json_data = {}
     json_data['energy zero price forecast'] = energy_zero_data
     json_data['entsoe price forecast'] = entsoe_data
@@ -287,86 +444,104 @@ if __name__ == "__main__":
                           "entsoe_price": "EUR/MWh"}
     json_data['metadata'] = {"energy_zero_source": "EnergyZero API v2.1",
                              "entsoe_source": "ENTSO-E Transparency Platform API v1.3"}    
-    with open(json_file_name, 'w', encoding='utf-8') as fp:
-        json.dump(json_data, fp, indent=4, sort_keys=True, default=str)
-    # copy the data to a current file to be downloaded by a client
-    shutil.copy(json_file_name, os.path.join(output_path, "energy_price_forecast.json"))
+    with open(json_file_name, 'wb') as fp:
+        fp.write(dumps_json(json_data, indent=True))
+    # long format, one row per source and hour; prices keep each source's unit (see 'units')
+    price_frame = pd.DataFrame(
+        [(timestamp, price, source)
+         for source, source_data in (('energy_zero', energy_zero_data), ('entsoe', entsoe_data)) if source_data
+         for timestamp, price in source_data.items()],
+        columns=['timestamp', 'price', 'source'])
+    price_frame['timestamp'] = pd.to_datetime(price_frame['timestamp'], utc=True).dt.tz_convert(local_timezone)
+    run_files += write_parquet(price_frame, json_file_name)
+    # link the data to a current file to be downloaded by a client
+    run_files += [json_file_name] + publish_latest(json_file_name, os.path.join(output_path, "energy_price_forecast.json"))
     # logging.info(f"energy_price_forecast data written to {json_file_name} and {os.path.join(output_path, "energy_price_forecast.json")}")
 
 # get the weather forecast data and write the data to a json file
-    data = meteo.read_json_url_weatherforecast(meteoserver_api_key, plaats, model='HARMONIE')  # Option 1: HARMONIE/HiRLAM
-    json_data = {}
-    json_data['weather forecast'] = data.to_dict(orient='records')
-    json_data['units'] = {
-        "temp": "°C",
-        "winds (mean wind velocity)": "m/s",
-        "windb (mean wind force)": "Beaufort",
-        "windknp (mean wind velocity)": "knots",
-        "windkmh (mean wind velocity)": "km/h",
-        "windr (wind direction)": "°",
-        "windrltr (wind direction)": "abbreviation",
-        "gust (wind gust, GFS only)": "m/s",
-        "gustb (wind gust, GFS only)": "Beaufort",
-        "gustkt (wind gust, GFS only)": "knots",
-        "gustkmh (wind gust, GFS only)": "km/h",
-        "vis (visibility)": "m",
-        "neersl (precipitation)": "mm",
-        "luchtd (air pressure)": "mbar / hPa",
-        "luchtdmmhg (air pressure)": "mm Hg",
-        "luchtdinhg (air pressure)": "inch Hg",
-        "rv (relative humidity)": "%",
-        "gr (global horizontal radiation)": "W/m²",
-        "hw (high cloud cover)": "%",
-        "mw (medium cloud cover)": "%",
-        "lw (low cloud cover)": "%",
-        "tw (total cloud cover)": "%",
-        "cape (convective available potential energy, GFS only)": "J/kg",
-        "cond": "weather condition code",
-        "ico": "weather icon code",
-        "samenv": "text",
-        "icoon": "image name"
-    }
-    json_data['metadata'] = {"plaats": plaats,
-                             "data_timezone": local_timezone,
-                             "model": "HARMONIE (Benelux)"}
-    json_file_name = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}{local_timezone}_weather_forecast.json")
-    with open(json_file_name, 'w', encoding='utf-8') as fp:
-        json.dump(json_data, fp, indent=4, sort_keys=True, default=str)
-    # copy the data to a current file to be downloaded by a client
-    shutil.copy(json_file_name, os.path.join(output_path, "weather_forecast.json"))    
-    # logging.info(f"weather_forecast data written to {json_file_name} and {os.path.join(output_path, "weather_forecast.json")}")
+    if weather_forecast is not None:
+        json_data = {}
+        json_data['weather forecast'] = None  # filled from the DataFrame by dump_with_records
+        json_data['units'] = {
+            "temp": "°C",
+            "winds (mean wind velocity)": "m/s",
+            "windb (mean wind force)": "Beaufort",
+            "windknp (mean wind velocity)": "knots",
+            "windkmh (mean wind velocity)": "km/h",
+            "windr (wind direction)": "°",
+            "windrltr (wind direction)": "abbreviation",
+            "gust (wind gust, GFS only)": "m/s",
+            "gustb (wind gust, GFS only)": "Beaufort",
+            "gustkt (wind gust, GFS only)": "knots",
+            "gustkmh (wind gust, GFS only)": "km/h",
+            "vis (visibility)": "m",
+            "neersl (precipitation)": "mm",
+            "luchtd (air pressure)": "mbar / hPa",
+            "luchtdmmhg (air pressure)": "mm Hg",
+            "luchtdinhg (air pressure)": "inch Hg",
+            "rv (relative humidity)": "%",
+            "gr (global horizontal radiation)": "W/m²",
+            "hw (high cloud cover)": "%",
+            "mw (medium cloud cover)": "%",
+            "lw (low cloud cover)": "%",
+            "tw (total cloud cover)": "%",
+            "cape (convective available potential energy, GFS only)": "J/kg",
+            "cond": "weather condition code",
+            "ico": "weather icon code",
+            "samenv": "text",
+            "icoon": "image name"
+        }
+        json_data['metadata'] = {"plaats": plaats,
+                                 "data_timezone": TIMEZONE_TAG,
+                                 "model": "HARMONIE (Benelux)"}
+        json_file_name = os.path.join(output_path, f"{run_tag}{TIMEZONE_TAG}_weather_forecast.json")
+        with open(json_file_name, 'wb') as fp:
+            dump_with_records(fp, json_data, 'weather forecast', weather_forecast)
+        run_files += write_parquet(weather_forecast, json_file_name)
+        # link the data to a current file to be downloaded by a client
+        run_files += [json_file_name] + publish_latest(json_file_name, os.path.join(output_path, "weather_forecast.json"))    
+        # logging.info(f"weather_forecast data written to {json_file_name} and {os.path.join(output_path, "weather_forecast.json")}")
 
 # get the sun forecast data and write the data to a json file
-    current, forecast, location = meteo.read_json_url_sunData(meteoserver_api_key, plaats, loc=True, numeric=False)
-    json_data = {}
-    json_data['sun forecast'] = forecast.to_dict(orient='records')
-    json_data['units'] = {
-        "temp": "°C",
-        "elev (sun altitude at the start of the current hour)": "°",
-        "az (sun azimuth at the start of the current hour,  N=0, E=90)": "°",
-        "gr (global horizontal radiation intensity)": "J/hr/cm²",
-        "gr_w (global horizontal radiation intensity)": "W/m²",
-        "sd (number of sunshine minutes in the current hour)": "min",
-        "tc (total cloud cover)": "%",
-        "lc (low-cloud cover)": "%",
-        "mc (intermediate-cloud cover)": "%",
-        "hc (high-cloud cover)": "%",
-        "vis (visibility)": "m",
-        "prec (total precipitation in the current hour)": "mm(/h)"
-    }
-    # json_data['current'] = current.to_dict(orient='records')    
-    json_data['metadata'] = {"plaats": plaats,
-                             "data_timezone": local_timezone}    
-    json_file_name = os.path.join(output_path, f"{datetime.now().strftime('%y%m%d_%H%M%S')}{local_timezone}_sun_forecast.json")
-    with open(json_file_name, 'w', encoding='utf-8') as fp:
-        json.dump(json_data, fp, indent=4, sort_keys=True, default=str)
-    # copy the data to a current file to be downloaded by a client
-    shutil.copy(json_file_name, os.path.join(output_path, "sun_forecast.json"))    
-    # logging.info(f"sun_forecast data written to {json_file_name} and {os.path.join(output_path, "sun_forecast.json")}")
+    if sun_data is not None:
+        current, forecast, _ = sun_data
+        json_data = {}
+        json_data['sun forecast'] = None  # filled from the DataFrame by dump_with_records
+        json_data['units'] = {
+            "temp": "°C",
+            "elev (sun altitude at the start of the current hour)": "°",
+            "az (sun azimuth at the start of the current hour,  N=0, E=90)": "°",
+            "gr (global horizontal radiation intensity)": "J/hr/cm²",
+            "gr_w (global horizontal radiation intensity)": "W/m²",
+            "sd (number of sunshine minutes in the current hour)": "min",
+            "tc (total cloud cover)": "%",
+            "lc (low-cloud cover)": "%",
+            "mc (intermediate-cloud cover)": "%",
+            "hc (high-cloud cover)": "%",
+            "vis (visibility)": "m",
+            "prec (total precipitation in the current hour)": "mm(/h)"
+        }
+        # json_data['current'] = current.to_dict(orient='records')    
+        json_data['metadata'] = {"plaats": plaats,
+                                 "data_timezone": TIMEZONE_TAG}    
+        json_file_name = os.path.join(output_path, f"{run_tag}{TIMEZONE_TAG}_sun_forecast.json")
+        with open(json_file_name, 'wb') as fp:
+            dump_with_records(fp, json_data, 'sun forecast', forecast)
+        run_files += write_parquet(forecast, json_file_name)
+        # link the data to a current file to be downloaded by a client
+        run_files += [json_file_name] + publish_latest(json_file_name, os.path.join(output_path, "sun_forecast.json"))    
+        # logging.info(f"sun_forecast data written to {json_file_name} and {os.path.join(output_path, "sun_forecast.json")}")
 
 # copy the data to remote storage
-    if REMOTE_STORAGE_PATH is not None and REMOTE_STORAGE_PATH is not None:
+    if REMOTE_STORAGE_PATH is not None and run_files:
         try:
-            subprocess.run(['rclone', 'copy', output_path, REMOTE_STORAGE_PATH], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            # only this run's files: --files-from + --no-traverse skips listing
+            # both the local and the remote directory
+            files_from = os.path.join(output_path, 'rclone_files.txt')
+            with open(files_from, 'w', encoding='utf-8') as fp:
+                fp.write('\n'.join(os.path.relpath(f, output_path) for f in run_files))
+            # detached: the upload outlives this run instead of holding up the exit
+            subprocess.Popen(['rclone', 'copy', '--files-from', files_from, '--no-traverse', output_path, REMOTE_STORAGE_PATH],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
         except Exception as e:
             logging.error(f"Error copying data to remote storage: {e}")
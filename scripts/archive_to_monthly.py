@@ -94,7 +94,7 @@ def main():
                 data = handler.decrypt_and_verify(raw)
                 stats["decrypted"] += 1
             with open(out_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+                f.write(json.dumps(data, indent=2, default=str))
         except Exception as e:
             logging.error(f"FAIL {name}: {e}")
             stats["errors"] += 1
@@ -112,7 +112,7 @@ if __name__ == "__main__":
                 
                 # Write decrypted data
                 with open(output_path, 'w') as f:
-                    json.dump(decrypted_data, f, indent=2, default=str)
+                    f.write(json.dumps(decrypted_data, indent=2, default=str))
                     
                 logging.info(f"Successfully decrypted: {filename}")
                 
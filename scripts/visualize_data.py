@@ -29,10 +29,10 @@ Description:
     visualization options.
 
 Dependencies:
-    - pandas: Data manipulation and analysis
+    - pandas / numpy: Data manipulation and analysis
     - matplotlib: Base plotting library
     - seaborn: Enhanced plotting and styling
-    - pytz: Timezone handling
+    - pyarrow (optional): Parquet cache of loaded price frames
     Required local packages:
     - utils.secure_data_handler: For encrypted data handling
     - utils.helpers: Configuration and file loading utilities
@@ -53,66 +53,195 @@ Notes:
     - Provides dark mode option for visualizations
 """
 import re
+import numpy as np
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 import glob
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
-import pytz
 import base64
+import hashlib
+from zoneinfo import ZoneInfo
+
+try:
+    import pyarrow as pa  # optional: enables the Parquet forecast cache
+    import pyarrow.dataset as pa_dataset
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
 
 from utils.secure_data_handler import SecureDataHandler
 from utils.helpers import load_config, load_data_file
 
-def load_price_forecast_range(start_date, end_date, file_path='data', handler: SecureDataHandler = None):
+PRICE_SOURCES = ['entsoe', 'energy_zero', 'epex', 'elspot']
+CACHE_SOURCES_KEY = b'energydatahub.sources'  # Parquet metadata key of the source fingerprint
+
+@lru_cache(maxsize=1)
+def get_handler(script_dir, secrets_file_name='secrets.ini'):
+    """Read the keys from the secrets file once and return a shared SecureDataHandler."""
+    config = load_config(script_dir, secrets_file_name)
+    encryption_key = base64.b64decode(config.get('security_keys', 'encryption'))
+    hmac_key = base64.b64decode(config.get('security_keys', 'hmac'))
+    return SecureDataHandler(encryption_key, hmac_key)
+
+def collect_prices(data, timestamps, prices, sources):
+    """Append the timestamp strings, EUR/MWh prices and source names in one loaded file to the buffers."""
+    for source in PRICE_SOURCES:
+        source_data = data.get(source, {}).get('data')
+        if not source_data:
+            continue
+        # Convert Energy Zero kWh to MWh
+        scale = 1000.0 if source == 'energy_zero' else 1.0
+        for timestamp, price in source_data.items():
+            if price is None:
+                continue
+            try:
+                price_float = float(price) * scale
+            except (TypeError, ValueError) as e:
+                print(f"Error processing timestamp {timestamp} or price {price}: {e}")
+                continue
+            timestamps.append(timestamp)
+            prices.append(price_float)
+            sources.append(source)
+
+def prices_frame(timestamps, prices, sources, timezone, start_date=None, end_date=None):
+    """Build the price DataFrame, parsing all timestamps in one vectorized call.
+
+    With start_date/end_date, rows outside the range are dropped together with
+    the unparseable ones, before the frame is built.
+    """
+    parsed = pd.to_datetime(timestamps, utc=True, format='ISO8601', errors='coerce').tz_convert(timezone)
+    invalid = parsed.isna()
+    if invalid.any():
+        print(f"Skipped {invalid.sum()} unparseable timestamps")
+    keep = ~invalid
+    if start_date is not None:
+        keep &= parsed >= start_date
+    if end_date is not None:
+        keep &= parsed <= end_date
+    return pd.DataFrame({
+        'timestamp': parsed[keep],
+        # float32 is ample for plotting EUR/MWh prices and halves the column
+        'price': np.asarray(prices, dtype=np.float32)[keep],
+        # few distinct values over many rows: store int codes, not repeated strings
+        'source': pd.Categorical(sources, categories=PRICE_SOURCES)[keep],
+    })
+
+def sources_fingerprint(json_files):
+    """Hash the names, sizes and mtimes of the JSON files a cache was built from."""
+    digest = hashlib.sha256()
+    for file in sorted(json_files):
+        stat = os.stat(file)
+        digest.update(f"{os.path.basename(file)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+def cached_sources_fingerprint(cache_file):
+    """Return the source fingerprint stored in a Parquet cache, or None."""
+    metadata = pq.read_schema(cache_file).metadata or {}
+    fingerprint = metadata.get(CACHE_SOURCES_KEY)
+    return fingerprint.decode() if fingerprint is not None else None
+
+def save_forecast_parquet(df, path, fingerprint=None):
+    """Cache a price frame as Parquet (UTC timestamps, dictionary-encoded source).
+
+    fingerprint (see sources_fingerprint) is stored in the file metadata so a
+    later load can tell whether the JSON files changed since.
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required to write the Parquet forecast cache")
+    df = df.assign(timestamp=df['timestamp'].dt.tz_convert('UTC'))
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if fingerprint is not None:
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), CACHE_SOURCES_KEY: fingerprint.encode()})
+    pq.write_table(table, path, compression='zstd')
+
+def load_price_forecast_range_parquet(start_date, end_date, cache_file):
+    """Load a date range from a Parquet forecast cache, filtering inside Arrow."""
+    ts_type = pa.timestamp('ns', tz='UTC')
+    start = pa.scalar(pd.Timestamp(start_date).tz_convert('UTC'), type=ts_type)
+    end = pa.scalar(pd.Timestamp(end_date).tz_convert('UTC'), type=ts_type)
+    table = pa_dataset.dataset(cache_file, format='parquet').to_table(
+        filter=(pa_dataset.field('timestamp') >= start) & (pa_dataset.field('timestamp') <= end))
+    df = table.to_pandas()
+    if df.empty:
+        raise ValueError("No valid data found for the specified time range")
+    df['timestamp'] = df['timestamp'].dt.tz_convert(start_date.tzinfo)
+    return df.sort_values('timestamp', kind='mergesort')
+
+def load_price_forecast_range(start_date, end_date, file_path='data', handler: SecureDataHandler = None,
+                              cache_file=None):
+    """Load all price forecasts in [start_date, end_date] from the JSON files in file_path.
+
+    With cache_file (and pyarrow), the decoded prices of every file are kept
+    there as Parquet, together with a fingerprint of the JSON files' names,
+    sizes and mtimes. The cache is only read while that fingerprint still
+    matches (so added, deleted or replaced files force a rebuild), and the
+    JSON files are read whenever it has no rows for the range.
+    Note the cache holds decrypted prices; keep it out of published folders.
+    """
     timezone = start_date.tzinfo
-    
-    all_data = []
     json_files = glob.glob(os.path.join(file_path, '*energy_price_forecast.json'))
+    use_cache = cache_file is not None and pa is not None
+
+    fingerprint = sources_fingerprint(json_files) if use_cache else None
+
+    if use_cache and os.path.exists(cache_file):
+        if cached_sources_fingerprint(cache_file) == fingerprint:
+            try:
+                return load_price_forecast_range_parquet(start_date, end_date, cache_file)
+            except ValueError:
+                pass  # the cache doesn't cover the range: read the JSON files
     
-    for file in json_files:
+    timestamps, prices, sources = [], [], []
+
+    def load_file(file):
         try:
-            data = load_data_file(file, handler)
-            
-            for source in ['entsoe', 'energy_zero', 'epex', 'elspot']:
-                if source in data:
-                    source_data = data[source]['data']
-                    for timestamp, price in source_data.items():
-                        try:
-                            dt = pd.to_datetime(timestamp).tz_convert(timezone)
-                            if start_date <= dt <= end_date and price is not None:
-                                # Convert Energy Zero kWh to MWh
-                                if source == 'energy_zero':
-                                    price_float = float(price) * 1000 if isinstance(price, (int, float, str)) else None
-                                else:
-                                    price_float = float(price) if isinstance(price, (int, float, str)) else None
-                                    
-                                if price_float is not None:
-                                    all_data.append({
-                                        'timestamp': dt,
-                                        'price': price_float,
-                                        'source': source
-                                    })
-                        except (ValueError, TypeError) as e:
-                            print(f"Error processing timestamp {timestamp} or price {price}: {e}")
+            return load_data_file(file, handler)
         except Exception as e:
             print(f"Error processing file {file}: {e}") 
+            return None
 
-    if not all_data:
+    # Files are independent: read, decrypt and decode them on a thread pool,
+    # then collect in file order on this thread
+    with ThreadPoolExecutor() as executor:
+        for file, data in zip(json_files, executor.map(load_file, json_files)):
+            if data is None:
+                continue
+            try:
+                collect_prices(data, timestamps, prices, sources)
+            except Exception as e:
+                print(f"Error processing file {file}: {e}") 
+
+    if use_cache:
+        # cache every file's prices, not just this range, so later ranges can use it
+        df = prices_frame(timestamps, prices, sources, timezone)
+        save_forecast_parquet(df, cache_file, fingerprint)
+        df = df[(df['timestamp'] >= start_date) & (df['timestamp'] <= end_date)]
+    else:
+        df = prices_frame(timestamps, prices, sources, timezone, start_date, end_date)
+    if df.empty:
         raise ValueError("No valid data found for the specified time range")
     
-    df = pd.DataFrame(all_data)
-    return df.sort_values('timestamp')
+    # each file's series is already chronological, so a stable (merge) sort
+    # only has to merge runs instead of a full quicksort
+    return df.sort_values('timestamp', kind='mergesort')
+
+BASE64_PATTERN = re.compile(r'^[A-Za-z0-9+/=]+$')
 
 def is_encrypted(json_data):
     if isinstance(json_data, str):
         # Check if it's a single long string with base64 characters
-        base64_pattern = r'^[A-Za-z0-9+/=]+$'
-        return bool(re.match(base64_pattern, json_data.strip()))
+        return BASE64_PATTERN.match(json_data.strip()) is not None
     return False
 
-def plot_prices(df, dark_mode=False):
+_style_dark_mode = None  # dark_mode value the matplotlib style was last applied for
+
+def plot_prices(df, dark_mode=False, ax=None):
+   global _style_dark_mode
    color_dict = {
        'entsoe': '#8884d8',
        'energy_zero': '#82ca9d', 
@@ -120,53 +249,44 @@ def plot_prices(df, dark_mode=False):
        'elspot': '#ff7300'
    }
 
-   if dark_mode:
-       plt.style.use('dark_background')
-       grid_color = '#404040'
-   else:
-       sns.set_style("whitegrid")
-       grid_color = '#cccccc'
+   # Switching styles rebuilds rcParams; only do it when the mode changes
+   if _style_dark_mode != dark_mode:
+       if dark_mode:
+           plt.style.use('dark_background')
+       else:
+           plt.style.use('default')
+           sns.set_style("whitegrid")
+       _style_dark_mode = dark_mode
+   grid_color = '#404040' if dark_mode else '#cccccc'
    
-   plt.figure(figsize=(15, 8))
+   if ax is None:
+       ax = plt.subplots(figsize=(15, 8))[1]
    
-   sns.lineplot(data=df, x='timestamp', y='price', hue='source', marker='o', palette=color_dict)
+   # Plain matplotlib lines per source; seaborn's estimator machinery is not needed here
+   for source, sub in df.groupby('source', observed=True, sort=False):
+       ax.plot(sub['timestamp'], sub['price'].to_numpy(), marker='o', color=color_dict[source], label=source)
+   ax.legend(title='source')
    
-   plt.grid(color=grid_color, linestyle='-', linewidth=1)
-   plt.title(f'Energy price forecasts\n{df.timestamp.min().strftime("%Y-%m-%d %H:%M")} to {df.timestamp.max().strftime("%Y-%m-%d %H:%M")}')
-   plt.xlabel('Time')
-   plt.ylabel('Price (EUR/MWh)')
-   plt.xticks(rotation=45)
-   plt.tight_layout()
+   ax.grid(color=grid_color, linestyle='-', linewidth=1)
+   ax.set_title(f'Energy price forecasts\n{df.timestamp.min().strftime("%Y-%m-%d %H:%M")} to {df.timestamp.max().strftime("%Y-%m-%d %H:%M")}')
+   ax.set_xlabel('Time')
+   ax.set_ylabel('Price (EUR/MWh)')
+   ax.tick_params(axis='x', labelrotation=45)
+   ax.figure.tight_layout()
    
-   return plt
+   return ax
 
 def load_price_forecast(json_file: str, handler: SecureDataHandler):
-    timezone = pytz.timezone('Europe/Amsterdam')
+    timezone = ZoneInfo('Europe/Amsterdam')
 
     try:
         data = load_data_file("data/energy_price_forecast.json", handler)
 
-        ret_data = []
-        for source in ['entsoe', 'energy_zero', 'epex', 'elspot']:
-            if source in data:
-                source_data = data[source]['data']
-                for timestamp, price in source_data.items():
-                    dt = pd.to_datetime(timestamp).tz_convert(timezone)
-
-                    if source == 'energy_zero':
-                        price_float = float(price) * 1000 if isinstance(price, (int, float, str)) else None
-                    else:
-                        price_float = float(price) if isinstance(price, (int, float, str)) else None
-                    if price_float is not None:
-                        ret_data.append({
-                            'timestamp': dt,
-                            'price': price_float,
-                            'source': source
-                        })
-
-        df = pd.DataFrame(ret_data)
-
-        return df.sort_values('timestamp')
+        timestamps, prices, sources = [], [], []
+        collect_prices(data, timestamps, prices, sources)
+        df = prices_frame(timestamps, prices, sources, timezone)
+
+        return df.sort_values('timestamp', kind='mergesort')
         
     except Exception as e:
         print(f"Error in main: {e}")
@@ -175,26 +295,23 @@ if __name__ == "__main__":
     SECRETS_FILE_NAME = 'secrets.ini'
 
     script_dir = os.path.dirname(os.path.abspath(__file__))    
-    config = load_config(script_dir, SECRETS_FILE_NAME)        
-    encryption_key = base64.b64decode(config.get('security_keys', 'encryption'))
-    hmac_key = base64.b64decode(config.get('security_keys', 'hmac'))
-    handler = SecureDataHandler(encryption_key, hmac_key)
+    handler = get_handler(script_dir, SECRETS_FILE_NAME)
 
     file_name = r"data\energy_price_forecast.json"
     df = load_price_forecast(file_name, handler)
     # print(df)
 
     # # Define time interval
-    # timezone = pytz.timezone('Europe/Amsterdam')
+    # timezone = ZoneInfo('Europe/Amsterdam')
     # end_date = datetime.now(timezone)
     # start_date = end_date - timedelta(days=100)
     
     # data_folder = r"..\..\05. Data\encrypted_data_since_2409"
     # df = load_price_forecast_range(start_date, end_date, data_folder, handler)
 
-    plot = plot_prices(df, dark_mode=True)
+    ax = plot_prices(df, dark_mode=True)
 
     # output_file = 'price_comparison_range.png'
-    # plot.savefig(output_file)
+    # ax.figure.savefig(output_file)
 
     plt.show()
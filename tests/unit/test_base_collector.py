@@ -5,6 +5,7 @@ Tests the abstract base collector class and retry mechanisms.
 """
 import pytest
 import asyncio
+import aiohttp
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from unittest.mock import AsyncMock, MagicMock
@@ -426,6 +427,34 @@ class TestCollectorQualityIssuesHook:
         assert collector._collector_quality_issues[0]['details']['tag'] == 'original'
 
 
+class TestClientSession:
+    """Tests for the shared-session hook."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_uses_injected_session_without_closing_it(self):
+        collector = MockCollector()
+        async with aiohttp.ClientSession() as shared:
+            collector.session = shared
+            async with collector._client_session() as session:
+                assert session is shared
+            assert not shared.closed
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_private_session_when_none_or_closed(self):
+        collector = MockCollector()
+        async with collector._client_session() as session:
+            private = session
+        assert private.closed
+
+        shared = aiohttp.ClientSession()
+        await shared.close()
+        collector.session = shared
+        async with collector._client_session() as session:
+            assert session is not shared
+
+
 class TestRetryConfig:
     """Tests for RetryConfig."""
 
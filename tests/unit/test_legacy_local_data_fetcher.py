@@ -0,0 +1,74 @@
+"""
+Unit Tests for the Legacy Local Data Fetcher
+--------------------------------------------
+Tests that dump_with_records writes valid JSON with the DataFrame rows
+spliced in, in the format the published weather/sun files always had.
+
+File: tests/unit/test_legacy_local_data_fetcher.py
+Created: 2026-10-17
+"""
+
+import datetime
+import importlib
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import utils.helpers as helpers
+
+for _dependency in ('meteoserver', 'energyzero', 'entsoe'):
+    pytest.importorskip(_dependency)
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def fetcher(request, tmp_path, monkeypatch):
+    # the module prunes <cwd>/data/*.json on import; keep that away from the repo
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module('legacy.local_data_fetcher')
+    if request.param == 'json':
+        monkeypatch.setattr(helpers, 'ORJSON_AVAILABLE', False)
+    elif not helpers.ORJSON_AVAILABLE:
+        pytest.skip('orjson not installed')
+    return module
+
+
+@pytest.fixture
+def forecast():
+    return pd.DataFrame({
+        'tijd_nl': pd.to_datetime(['2025-10-25 12:00:00', '2025-10-25 13:00:00']),
+        'cet': pd.to_datetime(['2025-10-25 12:00:00', None]).tz_localize('Europe/Amsterdam'),
+        'sr': [datetime.time(7, 30), datetime.time(7, 31)],
+        'temp': [12.5, np.nan],
+        'samenv': ['Zonnig', 'Bewölkt'],
+    })
+
+
+class TestDumpWithRecords:
+    def test_round_trips_through_json_loads(self, fetcher, forecast):
+        buf = io.BytesIO()
+        json_data = {'weather forecast': None, 'units': {'temp': '°C'}}
+        fetcher.dump_with_records(buf, json_data, 'weather forecast', forecast)
+
+        out = json.loads(buf.getvalue().decode('utf-8'))
+
+        assert list(out) == ['weather forecast', 'units']
+        assert out['units'] == {'temp': '°C'}
+        first, second = out['weather forecast']
+        assert first == {
+            'tijd_nl': '2025-10-25 12:00:00',
+            'cet': '2025-10-25 12:00:00+02:00',
+            'sr': '07:30:00',
+            'temp': 12.5,
+            'samenv': 'Zonnig',
+        }
+        assert second['cet'] is None
+        assert second['temp'] is None
+        assert second['samenv'] == 'Bewölkt'
+
+    def test_leaves_placeholder_dict_untouched(self, fetcher, forecast):
+        json_data = {'sun forecast': None}
+        fetcher.dump_with_records(io.BytesIO(), json_data, 'sun forecast', forecast)
+        assert json_data == {'sun forecast': None}
@@ -10,6 +10,7 @@ Created: 2025-10-25
 import pytest
 import asyncio
 import platform
+import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, AsyncMock
 from collectors.luchtmeetnet import LuchtmeetnetCollector
@@ -440,6 +441,52 @@ class TestLuchtmeetnetCacheIntegration:
                     mock_meas.assert_called_once()
 
 
+class TestLuchtmeetnetDiskCache:
+    """Test the on-disk station cache that survives between runs."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_process_uses_disk_cache(self, tmp_path):
+        """A new process (empty class cache) should read the file, not the API."""
+        mock_stations = [
+            {'number': 'NL001', 'latitude': 52.37, 'longitude': 4.89}
+        ]
+        LuchtmeetnetCollector._station_cache = None
+        LuchtmeetnetCollector._cache_timestamp = None
+        first = LuchtmeetnetCollector(52.37, 4.89, cache_dir=str(tmp_path))
+        with patch.object(first, '_fetch_all_stations', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = mock_stations
+            await first._get_stations_cached(AsyncMock())
+
+        # Simulate the next cron run
+        LuchtmeetnetCollector._station_cache = None
+        LuchtmeetnetCollector._cache_timestamp = None
+        second = LuchtmeetnetCollector(52.37, 4.89, cache_dir=str(tmp_path))
+        with patch.object(second, '_fetch_all_stations', new_callable=AsyncMock) as mock_fetch:
+            stations = await second._get_stations_cached(AsyncMock())
+
+        assert stations == mock_stations
+        mock_fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expired_disk_cache_refetches(self, tmp_path):
+        """A disk cache older than 24 hours should be ignored."""
+        LuchtmeetnetCollector._station_cache = None
+        LuchtmeetnetCollector._cache_timestamp = None
+        collector = LuchtmeetnetCollector(52.37, 4.89, cache_dir=str(tmp_path))
+        collector._save_station_disk_cache([{'number': 'NL001'}], None)
+        with patch('collectors.luchtmeetnet.time.time', return_value=time.time() + 25 * 3600):
+            assert collector._load_station_disk_cache() is None
+
+    def test_disk_cache_drops_malformed_station_numbers(self, tmp_path):
+        """The file is re-validated with the same allowlist as a live fetch."""
+        collector = LuchtmeetnetCollector(52.37, 4.89, cache_dir=str(tmp_path))
+        collector._save_station_disk_cache(
+            [{'number': 'NL001'}, {'number': '../etc/passwd'}], None
+        )
+        stations, _, _ = collector._load_station_disk_cache()
+        assert [s['number'] for s in stations] == ['NL001']
+
+
 class TestLuchtmeetnetStationFilter:
     """Regression: stations missing lat/lon must not poison the cache.
 
@@ -0,0 +1,93 @@
+"""
+Unit Tests for Market Proxy Cache
+---------------------------------
+Tests that a fresh on-disk cache short-circuits the Alpha Vantage/yfinance
+calls, and that a stale-but-valid cache is only used as a failure fallback.
+
+File: tests/unit/test_market_proxy_cache.py
+Created: 2026-10-17
+"""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from collectors.market_proxies import MarketProxyCollector
+
+AMS = ZoneInfo('Europe/Amsterdam')
+CACHED = {
+    'carbon': {'ticker': 'KRBN', 'price': 30.0, 'source': 'alpha_vantage'},
+    'gas_ttf': {'ticker': 'TTF=F', 'price': 35.0, 'source': 'yfinance'},
+    'gas': {'ticker': 'UNG', 'price': 14.0, 'source': 'alpha_vantage'},
+}
+
+
+def _age_cache(collector, hours):
+    """Rewrite cached_at (and re-sign) so the cache looks `hours` old."""
+    with open(collector._cache_file) as f:
+        cached = json.load(f)
+    cached.pop('signature')
+    cached['cached_at'] = (datetime.now(AMS) - timedelta(hours=hours)).isoformat()
+    cached['signature'] = collector._compute_cache_signature(json.dumps(cached, sort_keys=True))
+    with open(collector._cache_file, 'w') as f:
+        json.dump(cached, f)
+
+
+@pytest.fixture
+def collector(tmp_path):
+    return MarketProxyCollector(api_key='test', cache_dir=str(tmp_path))
+
+
+class TestFreshCache:
+    @pytest.mark.asyncio
+    async def test_fresh_cache_skips_api_calls(self, collector):
+        collector._save_cache(CACHED)
+
+        with patch.object(collector, '_fetch_commodity', new_callable=AsyncMock) as mock_av, \
+             patch.object(collector, '_fetch_ttf_yfinance', new_callable=AsyncMock) as mock_yf:
+            now = datetime.now(AMS)
+            result = await collector._fetch_raw_data(now, now)
+
+        assert result == CACHED
+        mock_av.assert_not_called()
+        mock_yf.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_refetches(self, collector):
+        collector._save_cache(CACHED)
+        _age_cache(collector, hours=12)
+
+        fresh = {'ticker': 'KRBN', 'price': 31.0, 'source': 'alpha_vantage'}
+        with patch.object(collector, '_fetch_commodity', new_callable=AsyncMock, return_value=fresh) as mock_av, \
+             patch.object(collector, '_fetch_ttf_yfinance', new_callable=AsyncMock, return_value=None), \
+             patch.object(collector, 'API_RATE_LIMIT_DELAY', 0):
+            now = datetime.now(AMS)
+            result = await collector._fetch_raw_data(now, now)
+
+        assert mock_av.await_count == 2
+        assert result['carbon']['price'] == 31.0
+
+    @pytest.mark.asyncio
+    async def test_partial_fresh_cache_refetches(self, collector):
+        collector._save_cache({'carbon': CACHED['carbon']})
+
+        with patch.object(collector, '_fetch_commodity', new_callable=AsyncMock, return_value=CACHED['gas']) as mock_av, \
+             patch.object(collector, '_fetch_ttf_yfinance', new_callable=AsyncMock, return_value=CACHED['gas_ttf']) as mock_yf, \
+             patch.object(collector, 'API_RATE_LIMIT_DELAY', 0):
+            now = datetime.now(AMS)
+            result = await collector._fetch_raw_data(now, now)
+
+        assert mock_av.await_count == 2
+        mock_yf.assert_awaited_once()
+        assert 'gas_ttf' in result
+
+    def test_load_cache_respects_max_age(self, collector):
+        collector._save_cache(CACHED)
+        _age_cache(collector, hours=12)
+
+        assert collector._load_cache(max_age_seconds=collector.CACHE_FRESH_SECONDS) is None
+        # Still inside the 48h fallback window
+        assert collector._load_cache() == CACHED
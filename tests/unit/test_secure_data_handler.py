@@ -74,6 +74,13 @@ class TestRoundTrip:
         assert handler.decrypt_and_verify(handler.encrypt_and_sign(data)) == data
 
 
+    def test_pre_encoded_json_bytes_roundtrip(self, handler, payload):
+        """Callers may hand over UTF-8 JSON bytes instead of a dict; the envelope
+        is the same, so decrypt_and_verify returns the parsed payload."""
+        blob = handler.encrypt_and_sign(json.dumps(payload).encode("utf-8"))
+        assert handler.decrypt_and_verify(blob) == payload
+
+
 class TestOutputShape:
     def test_output_is_ascii_base64(self, handler, payload):
         out = handler.encrypt_and_sign(payload)
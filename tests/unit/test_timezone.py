@@ -229,6 +229,20 @@ class TestEnsureTimezone:
         assert end_result.tzinfo is not None
         assert isinstance(tz_result, pytz.tzinfo.BaseTzInfo)
 
+    @pytest.mark.unit
+    @pytest.mark.timezone
+    def test_ensure_timezone_keeps_zoneinfo(self):
+        """ZoneInfo input is returned as ZoneInfo, not converted to pytz"""
+        amsterdam_tz = ZoneInfo('Europe/Amsterdam')
+        start = datetime(2025, 10, 24, 0, 0, 0, tzinfo=amsterdam_tz)
+        end = datetime(2025, 10, 25, 0, 0, 0, tzinfo=amsterdam_tz)
+
+        start_result, end_result, tz_result = ensure_timezone(start, end)
+
+        assert tz_result is amsterdam_tz
+        assert start_result == start
+        assert end_result.isoformat() == '2025-10-25T00:00:00+02:00'
+
 
 class TestGetTimezone:
     """Tests for get_timezone function"""
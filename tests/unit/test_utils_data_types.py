@@ -83,6 +83,15 @@ class TestEnhancedDataSet:
         assert result['metadata'] == metadata
         assert result['data'] == data
 
+    def test_to_dict_reused_until_reassigned(self):
+        dataset = EnhancedDataSet(metadata={'data_type': 'test'}, data={'a': 1})
+
+        first = dataset.to_dict()
+        assert dataset.to_dict() is first
+
+        dataset.data = {'b': 2}
+        assert dataset.to_dict() == {'metadata': dataset.metadata, 'data': {'b': 2}}
+
     def test_write_to_json(self, tmp_path):
         """Test writing to JSON file."""
         metadata = {'data_type': 'energy_price', 'source': 'Test'}
@@ -138,6 +147,37 @@ class TestEnhancedDataSet:
         for value in dataset.data.values():
             assert isinstance(value, dict)
 
+    def test_validate_mixed_series_falls_back_per_value(self):
+        """A single non-plain value sends the series through convert_value."""
+        data = {
+            '2025-10-25T12:00:00+02:00': 1,
+            '2025-10-25T13:00:00+02:00': 2.5,
+            '2025-10-25T14:00:00+02:00': float('nan'),
+            '2025-10-25T15:00:00+02:00': '7',
+        }
+        dataset = EnhancedDataSet(metadata={'data_type': 'energy_price'}, data=data)
+
+        assert list(dataset.data.values()) == [1, 2.5, None, 7]
+
+    def test_validate_plain_series_is_copied(self):
+        data = {'2025-10-25T12:00:00+02:00': 1, '2025-10-25T13:00:00+02:00': 2.5}
+        dataset = EnhancedDataSet(metadata={'data_type': 'energy_price'}, data=data)
+
+        assert dataset.data == data
+        assert dataset.data is not data
+
+    def test_getitem(self):
+        """Test dict-style access to metadata and data."""
+        dataset = EnhancedDataSet(
+            metadata={'data_type': 'energy_price'},
+            data={'2025-10-25T12:00:00+02:00': 100.5}
+        )
+
+        assert dataset['data'] == {'2025-10-25T12:00:00+02:00': 100.5}
+        assert dataset['metadata']['data_type'] == 'energy_price'
+        with pytest.raises(KeyError):
+            dataset['missing']
+
     def test_empty_data(self):
         """Test with empty data."""
         metadata = {'data_type': 'energy_price'}
@@ -252,13 +292,65 @@ class TestCombinedDataSet:
         assert loaded_meta['data_type'] == 'energy_price'
         assert loaded_meta['source'] == 'Test'
 
+    def test_write_to_stream_matches_to_dict(self):
+        """The streamed file parses to exactly the to_dict() envelope."""
+        import io
+
+        combined = CombinedDataSet()
+        combined.add_dataset('a', EnhancedDataSet(
+            metadata={'data_type': 'energy_price'},
+            data={'2025-10-25T12:00:00+02:00': 100.5}))
+        combined.add_dataset('b "quoted"', EnhancedDataSet(
+            metadata={'data_type': 'weather'},
+            data={'2025-10-25T12:00:00+02:00': {'temp': 'Ω'}}))
+
+        buf = io.BytesIO()
+        combined.write_to_stream(buf)
+
+        assert json.loads(buf.getvalue()) == combined.to_dict()
+
+    def test_write_to_stream_empty(self):
+        import io
+
+        buf = io.BytesIO()
+        CombinedDataSet().write_to_stream(buf)
+
+        assert json.loads(buf.getvalue())['data'] == {}
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_write_to_stream_keeps_indented_layout(self, use_orjson):
+        """Streaming writes the same bytes as indenting the whole envelope,
+        on both the orjson and the stdlib json path."""
+        import io
+        from unittest.mock import patch
+        from utils.helpers import dumps_json, ORJSON_AVAILABLE
+
+        if use_orjson and not ORJSON_AVAILABLE:
+            pytest.skip('orjson not installed')
+        combined = CombinedDataSet()
+        combined.add_dataset('a', EnhancedDataSet(
+            metadata={'data_type': 'energy_price'},
+            data={'2025-10-25T12:00:00+02:00': 100.5}))
+        combined.add_dataset('b', EnhancedDataSet(
+            metadata={'data_type': 'weather'},
+            data={'2025-10-25T12:00:00+02:00': {'temp': 'line\nbreak', 'wind': {}}}))
+
+        for dataset in (combined, CombinedDataSet()):
+            with patch('utils.helpers.ORJSON_AVAILABLE', use_orjson):
+                buf = io.BytesIO()
+                dataset.write_to_stream(buf)
+                assert buf.getvalue() == dumps_json(dataset.to_dict(), indent=True)
+
     def test_bool_evaluation_empty(self):
         """Test boolean evaluation with empty dataset."""
         combined = CombinedDataSet()
 
-        # CombinedDataSet doesn't implement __bool__, so always truthy
-        # Check emptiness via len(datasets) instead
+        # Falsy until a dataset has been added
         assert len(combined.datasets) == 0
+        assert not combined
+
+        combined.add_dataset('failed', None)
+        assert not combined
 
     def test_bool_evaluation_with_data(self):
         """Test boolean evaluation with data."""
@@ -269,8 +361,8 @@ class TestCombinedDataSet:
         dataset = EnhancedDataSet(metadata=metadata, data=data)
         combined.add_dataset('test', dataset)
 
-        # CombinedDataSet doesn't implement __bool__, check datasets instead
         assert len(combined.datasets) > 0
+        assert combined
 
     def test_multiple_sources_to_dict(self):
         """Test to_dict with multiple sources."""
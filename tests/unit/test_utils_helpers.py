@@ -24,7 +24,10 @@ from utils.helpers import (
     detect_file_type,
     validate_data_timestamps,
     save_data_file,
-    load_data_file
+    load_data_file,
+    link_or_copy,
+    dumps_json,
+    loads_json
 )
 
 
@@ -189,6 +192,13 @@ class TestConvertValue:
         assert convert_value(42.5) == 42.5
         assert convert_value("42.5") == 42.5
 
+    def test_convert_exponent_and_special_floats(self):
+        """Test exponent notation and inf/nan strings still parse as floats."""
+        assert convert_value("1e5") == 100000.0
+        assert isinstance(convert_value("1e5"), float)
+        assert convert_value("inf") == float("inf")
+        assert convert_value("hello") == "hello"
+
     def test_convert_dash_to_none(self):
         """Test dash converts to None."""
         assert convert_value('-') is None
@@ -463,6 +473,24 @@ class TestSaveDataFile:
         assert loaded['metadata']['version'] == '2.0'
         assert 'test' in loaded['data']
 
+    def test_save_unencrypted_builds_dict_once(self, tmp_path):
+        """The validated dict is written as-is; to_dict() is not called again."""
+        from utils.data_types import EnhancedDataSet
+
+        dataset = EnhancedDataSet(
+            metadata={'data_type': 'test'},
+            data={'2025-10-25T12:00:00+02:00': 42.0}
+        )
+        file_path = tmp_path / "output.json"
+
+        with patch.object(EnhancedDataSet, 'to_dict', autospec=True,
+                          side_effect=lambda self: {'metadata': self.metadata, 'data': self.data}) as to_dict:
+            save_data_file(dataset, str(file_path), encrypt=False)
+
+        assert to_dict.call_count == 1
+        with open(file_path) as f:
+            assert json.load(f)['data'] == {'2025-10-25T12:00:00+02:00': 42.0}
+
     def test_save_with_malformed_timestamps_raises_error(self, tmp_path):
         """Test that malformed timestamps prevent saving."""
         from utils.data_types import CombinedDataSet, EnhancedDataSet
@@ -481,6 +509,86 @@ class TestSaveDataFile:
             save_data_file(combined, str(file_path), encrypt=False)
 
 
+class TestJsonCodec:
+    """Test the (optionally orjson-backed) JSON helpers, on both paths."""
+
+    @pytest.fixture(autouse=True, params=['orjson', 'json'])
+    def codec(self, request):
+        import utils.helpers as helpers
+
+        if request.param == 'orjson' and not helpers.ORJSON_AVAILABLE:
+            pytest.skip('orjson not installed')
+        with patch.object(helpers, 'ORJSON_AVAILABLE', request.param == 'orjson'):
+            yield request.param
+
+    def test_dumps_returns_parseable_bytes(self):
+        from datetime import datetime
+        from zoneinfo import ZoneInfo
+
+        ts = datetime(2025, 10, 25, 12, 0, tzinfo=ZoneInfo('Europe/Amsterdam'))
+        out = dumps_json({'when': ts, 'value': 1.5, 'name': 'Ω'})
+
+        assert isinstance(out, bytes)
+        assert json.loads(out) == {'when': '2025-10-25T12:00:00+02:00', 'value': 1.5, 'name': 'Ω'}
+
+    def test_loads_accepts_str_and_bytes(self):
+        assert loads_json('{"a": [1, null]}') == {'a': [1, None]}
+        assert loads_json(b'{"a": [1, null]}') == {'a': [1, None]}
+
+    def test_indent_uses_two_spaces(self):
+        assert dumps_json({'a': [1]}, indent=True) == b'{\n  "a": [\n    1\n  ]\n}'
+
+
+class TestLinkOrCopy:
+    """Test the latest-file alias helper."""
+
+    def test_creates_alias_with_same_content(self, tmp_path):
+        src = tmp_path / "250101_120000_feed.json"
+        src.write_text('{"a": 1}')
+        dst = tmp_path / "feed.json"
+
+        link_or_copy(str(src), str(dst))
+
+        assert dst.read_text() == '{"a": 1}'
+        assert not (tmp_path / "feed.json.tmp").exists()
+
+    def test_replaces_existing_alias(self, tmp_path):
+        old = tmp_path / "250101_120000_feed.json"
+        old.write_text('old')
+        new = tmp_path / "250102_120000_feed.json"
+        new.write_text('new')
+        dst = tmp_path / "feed.json"
+
+        link_or_copy(str(old), str(dst))
+        link_or_copy(str(new), str(dst))
+
+        assert dst.read_text() == 'new'
+        # The previous run's timestamped file is untouched
+        assert old.read_text() == 'old'
+
+    def test_falls_back_to_copy_when_link_fails(self, tmp_path):
+        src = tmp_path / "250101_120000_feed.json"
+        src.write_text('{"a": 1}')
+        dst = tmp_path / "feed.json"
+
+        with patch('utils.helpers.os.link', side_effect=OSError("no hardlinks")):
+            link_or_copy(str(src), str(dst))
+
+        assert dst.read_text() == '{"a": 1}'
+        assert os.stat(src).st_ino != os.stat(dst).st_ino
+
+    def test_relinking_same_source_leaves_no_temp_file(self, tmp_path):
+        src = tmp_path / "250101_120000_feed.json"
+        src.write_text('{"a": 1}')
+        dst = tmp_path / "feed.json"
+
+        link_or_copy(str(src), str(dst))
+        link_or_copy(str(src), str(dst))
+
+        assert dst.read_text() == '{"a": 1}'
+        assert not (tmp_path / "feed.json.tmp").exists()
+
+
 class TestLoadDataFile:
     """Test data file loading function."""
 
@@ -504,6 +612,14 @@ class TestLoadDataFile:
         with pytest.raises(ValueError, match="no handler provided"):
             load_data_file(str(file_path), handler=None)
 
+    def test_load_invalid_content_raises_value_error(self, tmp_path):
+        """Content that is neither JSON nor Base64 raises the same error as detect_file_type."""
+        file_path = tmp_path / "broken.json"
+        file_path.write_text('{"key": ')
+
+        with pytest.raises(ValueError, match="neither valid JSON nor base64"):
+            load_data_file(str(file_path))
+
     def test_load_nonexistent_file_raises_error(self):
         """Test loading non-existent file raises error."""
         with pytest.raises(Exception):
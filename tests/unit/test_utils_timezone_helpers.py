@@ -9,13 +9,14 @@ Created: 2025-10-25
 
 import pytest
 import pytz
-from datetime import datetime
+from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from unittest.mock import patch, MagicMock
 from utils.timezone_helpers import (
     get_timezone,
     get_timezone_and_country,
     compare_timezones,
+    fixed_offset_for_window,
     localize_naive_datetime,
     normalize_timestamp_to_amsterdam,
     validate_timestamp_format
@@ -158,6 +159,30 @@ class TestLocalizeNaiveDatetime:
         assert aware_dt.isoformat() == '2025-01-15T12:00:00+01:00'
 
 
+class TestFixedOffsetForWindow:
+    """Test the fixed-offset shortcut for short conversion windows."""
+
+    def test_window_without_dst_change_gets_fixed_offset(self):
+        """Test a summer day maps to a +02:00 fixed offset."""
+        tz = ZoneInfo('Europe/Amsterdam')
+        start = datetime(2026, 7, 1, tzinfo=tz)
+        fixed = fixed_offset_for_window(tz, start, start + timedelta(days=2))
+        assert fixed.utcoffset(None) == timedelta(hours=2)
+        assert start.astimezone(fixed).isoformat() == start.isoformat()
+
+    def test_window_across_dst_change_keeps_zone(self):
+        """Test a window spanning the October switch returns the zone itself."""
+        tz = ZoneInfo('Europe/Amsterdam')
+        start = datetime(2026, 10, 24, tzinfo=tz)
+        assert fixed_offset_for_window(tz, start, start + timedelta(days=2)) is tz
+
+    def test_long_window_keeps_zone(self):
+        """Test a window longer than the limit is never collapsed."""
+        tz = ZoneInfo('Europe/Amsterdam')
+        start = datetime(2026, 1, 1, tzinfo=tz)
+        assert fixed_offset_for_window(tz, start, datetime(2027, 1, 1, tzinfo=tz)) is tz
+
+
 class TestNormalizeTimestampToAmsterdam:
     """Test Amsterdam timestamp normalization function."""
 
@@ -0,0 +1,126 @@
+"""
+Unit tests for the Parquet forecast cache in `scripts/visualize_data.py`.
+
+Round-trips a price frame through save_forecast_parquet /
+load_price_forecast_range_parquet, and checks that load_price_forecast_range
+only trusts the cache while the JSON files it was built from are unchanged.
+
+File: tests/unit/test_visualize_data_script.py
+Created: 2026-10-17
+"""
+
+import importlib.util
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+pytest.importorskip("matplotlib")
+pytest.importorskip("seaborn")
+pytest.importorskip("pyarrow")
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+SCRIPT = REPO_ROOT / "scripts" / "visualize_data.py"
+
+# scripts/ is not a package, so load it by file path
+_spec = importlib.util.spec_from_file_location("visualize_data", SCRIPT)
+visualize_data = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(visualize_data)
+
+AMS = ZoneInfo("Europe/Amsterdam")
+START = datetime(2026, 10, 17, 0, 0, tzinfo=AMS)
+END = datetime(2026, 10, 17, 23, 0, tzinfo=AMS)
+
+
+def _write_forecast(path, hour, price):
+    data = {"entsoe": {"data": {f"2026-10-17T{hour:02d}:00:00+02:00": price}}}
+    path.write_text(json.dumps(data))
+
+
+class TestParquetCache:
+    def test_save_and_load_round_trip(self, tmp_path):
+        frame = visualize_data.prices_frame(
+            ["2026-10-17T10:00:00+02:00", "2026-10-17T11:00:00+02:00", "2026-10-18T10:00:00+02:00"],
+            [50.0, 0.25 * 1000, 70.0],
+            ["entsoe", "energy_zero", "epex"],
+            AMS,
+        )
+        cache = tmp_path / "cache.parquet"
+        visualize_data.save_forecast_parquet(frame, cache)
+
+        df = visualize_data.load_price_forecast_range_parquet(START, END, str(cache))
+
+        assert list(df["source"]) == ["entsoe", "energy_zero"]
+        assert list(df["price"]) == [50.0, 250.0]
+        assert str(df["timestamp"].dt.tz) == "Europe/Amsterdam"
+        assert df["timestamp"].iloc[0] == datetime(2026, 10, 17, 10, tzinfo=AMS)
+
+    def test_newer_json_bypasses_stale_cache(self, tmp_path):
+        cache = tmp_path / "cache.parquet"
+        _write_forecast(tmp_path / "a_energy_price_forecast.json", 10, 50.0)
+        first = visualize_data.load_price_forecast_range(START, END, str(tmp_path), cache_file=str(cache))
+        assert list(first["price"]) == [50.0]
+
+        newer = tmp_path / "b_energy_price_forecast.json"
+        _write_forecast(newer, 11, 60.0)
+        stamp = os.path.getmtime(cache) + 10
+        os.utime(newer, (stamp, stamp))
+
+        second = visualize_data.load_price_forecast_range(START, END, str(tmp_path), cache_file=str(cache))
+        assert sorted(second["price"]) == [50.0, 60.0]
+
+    def test_deleted_json_invalidates_cache(self, tmp_path):
+        cache = tmp_path / "cache.parquet"
+        _write_forecast(tmp_path / "a_energy_price_forecast.json", 10, 50.0)
+        _write_forecast(tmp_path / "b_energy_price_forecast.json", 11, 60.0)
+        first = visualize_data.load_price_forecast_range(START, END, str(tmp_path), cache_file=str(cache))
+        assert sorted(first["price"]) == [50.0, 60.0]
+
+        (tmp_path / "b_energy_price_forecast.json").unlink()
+
+        second = visualize_data.load_price_forecast_range(START, END, str(tmp_path), cache_file=str(cache))
+        assert list(second["price"]) == [50.0]
+
+    def test_json_replaced_with_older_mtime_invalidates_cache(self, tmp_path):
+        cache = tmp_path / "cache.parquet"
+        source = tmp_path / "a_energy_price_forecast.json"
+        _write_forecast(source, 10, 50.0)
+        first = visualize_data.load_price_forecast_range(START, END, str(tmp_path), cache_file=str(cache))
+        assert list(first["price"]) == [50.0]
+
+        _write_forecast(source, 10, 55.0)
+        stamp = os.path.getmtime(cache) - 3600
+        os.utime(source, (stamp, stamp))
+
+        second = visualize_data.load_price_forecast_range(START, END, str(tmp_path), cache_file=str(cache))
+        assert list(second["price"]) == [55.0]
+
+    def test_cache_without_fingerprint_is_rebuilt(self, tmp_path):
+        _write_forecast(tmp_path / "a_energy_price_forecast.json", 10, 50.0)
+        cache = tmp_path / "cache.parquet"
+        # a hand-made cache that was not built from these JSON files
+        other_day = visualize_data.prices_frame(["2026-10-20T10:00:00+02:00"], [1.0], ["epex"], AMS)
+        visualize_data.save_forecast_parquet(other_day, cache)
+
+        df = visualize_data.load_price_forecast_range(START, END, str(tmp_path), cache_file=str(cache))
+
+        assert list(df["price"]) == [50.0]
+        fingerprint = visualize_data.sources_fingerprint(
+            [str(tmp_path / "a_energy_price_forecast.json")])
+        assert visualize_data.cached_sources_fingerprint(cache) == fingerprint
+
+    def test_range_missing_from_cache_falls_back_to_json(self, tmp_path):
+        source = tmp_path / "a_energy_price_forecast.json"
+        _write_forecast(source, 10, 50.0)
+        cache = tmp_path / "cache.parquet"
+        # a current cache that has nothing for this range
+        other_day = visualize_data.prices_frame(["2026-10-20T10:00:00+02:00"], [1.0], ["epex"], AMS)
+        visualize_data.save_forecast_parquet(
+            other_day, cache, visualize_data.sources_fingerprint([str(source)]))
+
+        df = visualize_data.load_price_forecast_range(START, END, str(tmp_path), cache_file=str(cache))
+
+        assert list(df["price"]) == [50.0]
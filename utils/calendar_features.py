@@ -28,6 +28,7 @@ Usage:
 """
 
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from datetime import datetime, date, timedelta
 from typing import Dict, Any, Optional, List
 import holidays
@@ -181,18 +182,20 @@ def get_dst_info(dt: datetime) -> tuple[bool, bool, int]:
     return is_dst, is_transition, utc_offset_hours
 
 
-def get_calendar_features(dt: datetime) -> CalendarFeatures:
+@lru_cache(maxsize=512)
+def _get_date_features(d: date) -> Dict[str, Any]:
     """
-    Calculate calendar features for a given datetime.
+    Calculate the date-level calendar features (everything except hour and DST).
+
+    Cached per date: an hourly range evaluates each date 24 times and the
+    holiday lookups are the expensive part. Treat the result as read-only.
 
     Args:
-        dt: Datetime to calculate features for (should be timezone-aware)
+        d: Date to calculate features for
 
     Returns:
-        CalendarFeatures dataclass with all calendar-based features
+        Dict of CalendarFeatures fields that depend only on the date
     """
-    d = dt.date() if isinstance(dt, datetime) else dt
-
     # Basic time features
     day_of_week = d.weekday()  # 0=Monday, 6=Sunday
 
@@ -202,12 +205,6 @@ def get_calendar_features(dt: datetime) -> CalendarFeatures:
     is_holiday_be = d in BE_HOLIDAYS
     is_holiday_fr = d in FR_HOLIDAYS
 
-    # Holiday names
-    holiday_name_nl = NL_HOLIDAYS.get(d)
-    holiday_name_de = DE_HOLIDAYS.get(d)
-    holiday_name_be = BE_HOLIDAYS.get(d)
-    holiday_name_fr = FR_HOLIDAYS.get(d)
-
     # Holiday count and weighted impact
     holiday_flags = {
         'NL': is_holiday_nl,
@@ -223,23 +220,14 @@ def get_calendar_features(dt: datetime) -> CalendarFeatures:
     # Weekend and day type
     is_weekend = day_of_week >= 5
 
-    # Working day indicators
-    is_working_day = not is_weekend and not is_holiday_nl
-    is_working_day_regional = not is_weekend and holiday_count == 0
-
     # Season
-    month = d.month if isinstance(d, date) else dt.month
-    season = get_season(month)
+    season = get_season(d.month)
 
-    # DST features
-    is_dst, is_dst_transition, utc_offset_hours = get_dst_info(dt)
-
-    return CalendarFeatures(
+    return dict(
         # Basic time
         year=d.year,
         month=d.month,
         day=d.day,
-        hour=dt.hour if isinstance(dt, datetime) else 0,
         day_of_week=day_of_week,
         day_of_year=d.timetuple().tm_yday,
         week_of_year=d.isocalendar()[1],
@@ -258,16 +246,11 @@ def get_calendar_features(dt: datetime) -> CalendarFeatures:
         # Combined metrics
         holiday_count=holiday_count,
         holiday_impact=round(holiday_impact, 2),
-        is_bridge_day=is_bridge_day(dt) if isinstance(dt, datetime) else is_bridge_day(datetime.combine(d, datetime.min.time())),
+        is_bridge_day=is_bridge_day(datetime.combine(d, datetime.min.time())),
 
-        # Working day
-        is_working_day=is_working_day,
-        is_working_day_regional=is_working_day_regional,
-
-        # DST
-        is_dst=is_dst,
-        is_dst_transition_day=is_dst_transition,
-        dst_utc_offset_hours=utc_offset_hours,
+        # Working day indicators
+        is_working_day=not is_weekend and not is_holiday_nl,
+        is_working_day_regional=not is_weekend and holiday_count == 0,
 
         # Season
         is_winter=season == 'winter',
@@ -275,10 +258,34 @@ def get_calendar_features(dt: datetime) -> CalendarFeatures:
         season=season,
 
         # Holiday names
-        holiday_name_nl=holiday_name_nl,
-        holiday_name_de=holiday_name_de,
-        holiday_name_be=holiday_name_be,
-        holiday_name_fr=holiday_name_fr,
+        holiday_name_nl=NL_HOLIDAYS.get(d),
+        holiday_name_de=DE_HOLIDAYS.get(d),
+        holiday_name_be=BE_HOLIDAYS.get(d),
+        holiday_name_fr=FR_HOLIDAYS.get(d),
+    )
+
+
+def get_calendar_features(dt: datetime) -> CalendarFeatures:
+    """
+    Calculate calendar features for a given datetime.
+
+    Args:
+        dt: Datetime to calculate features for (should be timezone-aware)
+
+    Returns:
+        CalendarFeatures dataclass with all calendar-based features
+    """
+    d = dt.date() if isinstance(dt, datetime) else dt
+
+    # DST features
+    is_dst, is_dst_transition, utc_offset_hours = get_dst_info(dt)
+
+    return CalendarFeatures(
+        hour=dt.hour if isinstance(dt, datetime) else 0,
+        is_dst=is_dst,
+        is_dst_transition_day=is_dst_transition,
+        dst_utc_offset_hours=utc_offset_hours,
+        **_get_date_features(d),
     )
 
 
@@ -18,6 +18,7 @@ Author: Energy Data Hub Project
 """
 
 import logging
+from itertools import islice
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
@@ -546,7 +547,7 @@ def _count_data_points(data: Any, _max_depth: int = 5) -> int:
     """
     if not isinstance(data, dict) or _max_depth <= 0 or not data:
         return 0
-    keys_sample = list(data.keys())[:5]
+    keys_sample = list(islice(data, 5))
     if all(_is_timestamp_str(k) for k in keys_sample):
         return len(data)
     dict_children = [v for v in data.values() if isinstance(v, dict)]
@@ -591,7 +592,7 @@ def _flatten_to_timestamp_records(data: Dict[str, Any]) -> Dict[str, Any]:
     top-level keys parses as an ISO timestamp, treat as 1-level and
     return unchanged. Otherwise descend one level.
     """
-    for key in list(data.keys())[:3]:
+    for key in islice(data, 3):
         try:
             datetime.fromisoformat(str(key).replace('Z', '+00:00'))
             return data
@@ -1,14 +1,15 @@
-import json
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any
 import math
 
+from utils.helpers import dumps_json
 from utils.schema_registry import stamp_metadata
 
+# Strings that mean "no value"; matched after strip().lower()
+_NONE_STRINGS = frozenset({'', '-', 'n/a', 'nan', 'null', 'none', 'inf', '-inf', 'infinity', '-infinity'})
+
 def convert_value(value):
-    none_strings = ['', '-', 'n/a', 'nan', 'null', 'none', 'inf', '-inf', 'infinity', '-infinity']
-    
     # Handle None input
     if value is None:
         return None
@@ -19,16 +20,16 @@ def convert_value(value):
             return None
         return value
     
-    # If it's a string, convert to lowercase for comparison
-    if isinstance(value, str):
-        value_lower = value.strip().lower()
-        if value_lower in none_strings:
-            return None
-    
     # If it's already an int, return as is
     if isinstance(value, int):
         return value
     
+    # If it's a string, compare as-is first (skips the strip/lower copy for
+    # exact sentinels like '-'), then lowercased
+    if isinstance(value, str):
+        if value in _NONE_STRINGS or value.strip().lower() in _NONE_STRINGS:
+            return None
+    
     # Try converting to int, then float
     try:
         return int(value)
@@ -43,8 +44,25 @@ def convert_value(value):
             # If it's not a number, return the original value
             return value
 
+def _all_plain_numbers(values) -> bool:
+    """True if every value is an int or finite float, i.e. convert_value()
+    would return each one unchanged."""
+    for value in values:
+        value_type = type(value)
+        if value_type is int:
+            continue
+        if value_type is float and math.isfinite(value):
+            continue
+        return False
+    return True
+
+
 class EnhancedDataSet:
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ('metadata', 'data', '_envelope')
+
     def __init__(self, metadata: Dict[str, Any], data: Dict[str, Any]):
+        self._envelope = None
         self.metadata = stamp_metadata(metadata)
         data_type = metadata.get('data_type', 'unknown')
         if data_type == 'energy_price':
@@ -58,6 +76,9 @@ class EnhancedDataSet:
     def validate_weather_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         validated_data = {}
         for timestamp, values in data.items():
+            if _all_plain_numbers(values.values()):
+                validated_data[timestamp] = dict(values)
+                continue
             validated_values = {}
             for key, value in values.items():
                 validated_values[key] = convert_value(value)
@@ -65,12 +86,16 @@ class EnhancedDataSet:
         return validated_data
 
     def validate_energy_prices(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        # Collectors mostly hand over finite numbers already: check the whole
+        # series in one pass and only convert value-by-value when that fails
+        if _all_plain_numbers(data.values()):
+            return dict(data)
         validated_data = {timestamp: convert_value(value) for timestamp, value in data.items()}
         return validated_data    
 
     def __getitem__(self, key):
-        if key in self.__dict__:
-            return self.__dict__[key]
+        if key in ('metadata', 'data'):
+            return getattr(self, key)
         raise KeyError(f"{key} not found in EnhancedDataSet")
 
     def __str__(self):
@@ -80,26 +105,32 @@ class EnhancedDataSet:
         return self.__str__()    
 
     def to_dict(self):
-        return {
-            'metadata': self.metadata,
-            'data': self.data
-        }
+        # Built once and reused (save, combine and shape-signature all ask for
+        # it); rebuilt if metadata or data has been reassigned since
+        envelope = self._envelope
+        if envelope is None or envelope['metadata'] is not self.metadata or envelope['data'] is not self.data:
+            envelope = self._envelope = {
+                'metadata': self.metadata,
+                'data': self.data
+            }
+        return envelope
     
     def write_to_json(self, filename: str):
-        def json_serializer(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Type {type(obj)} not serializable")
-
-        with open(filename, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2, default=json_serializer)
+        with open(filename, 'wb') as f:
+            f.write(dumps_json(self.to_dict(), indent=True))
         print(f"Data written to {filename}")   
     
 class CombinedDataSet:
+    __slots__ = ('datasets', 'version')
+
     def __init__(self):
         self.datasets = {}
         self.version = "2.0"
 
+    def __bool__(self):
+        # Empty when every add_dataset() call got None (all sources failed)
+        return bool(self.datasets)
+
     def add_dataset(self, name: str, dataset: EnhancedDataSet):
         if name in self.datasets:
             raise ValueError(f"Dataset with name {name} already exists")
@@ -113,25 +144,42 @@ class CombinedDataSet:
         # and the 14 already-homogenised strategic feeds (issue #26). The
         # per-collector sub-datasets keep their own {metadata, data} wrap
         # under the top-level `data` key.
-        metadata = stamp_metadata({
+        return {
+            'metadata': self._metadata(),
+            'data': self.datasets,
+        }
+
+    def _metadata(self):
+        return stamp_metadata({
             'version': self.version,
             'source': 'aggregated',
             'data_type': 'combined',
             'units': 'mixed',
         })
-        return {
-            'metadata': metadata,
-            'data': self.datasets,
-        }
-    
-    def write_to_json(self, filename: str):
-        def json_serializer(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Type {type(obj)} not serializable")
 
-        with open(filename, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2, default=json_serializer)
+    def write_to_stream(self, fp):
+        """Write the to_dict() envelope to a binary file one sub-dataset at a
+        time, so only a single dataset's JSON is in memory at once.
+
+        The bytes match dumps_json(self.to_dict(), indent=True): each part is
+        indented on its own and shifted to its nesting depth. JSON strings
+        escape newlines, so every raw newline is indentation whitespace.
+        """
+        fp.write(b'{\n  "metadata": ')
+        fp.write(dumps_json(self._metadata(), indent=True).replace(b'\n', b'\n  '))
+        if not self.datasets:
+            fp.write(b',\n  "data": {}\n}')
+            return
+        fp.write(b',\n  "data": {')
+        for i, (name, dataset) in enumerate(self.datasets.items()):
+            fp.write(b',\n    ' if i else b'\n    ')
+            fp.write(dumps_json(name) + b': ')
+            fp.write(dumps_json(dataset, indent=True).replace(b'\n', b'\n    '))
+        fp.write(b'\n  }\n}')
+
+    def write_to_json(self, filename: str):
+        with open(filename, 'wb') as f:
+            self.write_to_stream(f)
 
 if __name__ == "__main__":
     energy_prices = EnhancedDataSet(
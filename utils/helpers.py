@@ -1,11 +1,23 @@
 import os
 import re
 import json
+import shutil
 import logging
 from math import cos, asin, sqrt
+import numpy as np
+from datetime import datetime
 from configparser import ConfigParser
 from typing import Any, Dict
 
+# orjson is optional: when installed it serializes/parses the published JSON
+# several times faster than the stdlib (output is still plain JSON)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 def ensure_output_directory(path: str) -> None:
     """Ensure the output directory exists."""
     try:
@@ -113,19 +125,23 @@ def load_config(script_dir: str, filename: str = 'secrets.ini') -> ConfigParser:
     return load_secrets(script_dir, filename)
 
 def convert_value(value):
-    if type(value) == int or type(value) == float:
+    if isinstance(value, (int, float)):
         return value
     if value == '-':
         return None  # Using None instead of NaN for JSON compatibility
     elif value.lower() == 'none':
         return None
+    # Try the likely parser first, so decimal cells don't raise out of int()
+    looks_float = '.' in value or 'e' in value or 'E' in value
     try:
-        return int(value)
+        return float(value) if looks_float else int(value)
     except ValueError:
-        try:
-            return float(value)
-        except ValueError:
+        if looks_float:
             return value  # Keep as string if it's not a number
+    try:
+        return float(value)  # 'inf', 'nan'
+    except ValueError:
+        return value
         
 def distance(lat1, lon1, lat2, lon2):
     p = 0.017453292519943295
@@ -157,12 +173,14 @@ def closest(data, v):
         ValueError: empty ``data``, missing keys on ``v``, or any entry
             in ``data`` missing required keys.
     """
+    data = list(data)
     if not data:
         raise ValueError("closest(): data is empty — no candidates to choose from")
     if "latitude" not in v:
         raise ValueError(f"closest(): target missing latitude: {v!r}")
     if "longitude" not in v:
         raise ValueError(f"closest(): target missing longitude: {v!r}")
+    lats, lons = [], []
     for i, p in enumerate(data):
         # Identify the offending entry by index + its `number` or `name` if
         # present. Falls back to "<index N>" rather than echoing the full
@@ -176,12 +194,23 @@ def closest(data, v):
             raise ValueError(f"closest(): entry missing latitude: {identifier}")
         if "longitude" not in p:
             raise ValueError(f"closest(): entry missing longitude: {identifier}")
-    return min(
-        data,
-        key=lambda p: distance(
-            v["latitude"], v["longitude"], p["latitude"], p["longitude"]
-        ),
+        lats.append(p["latitude"])
+        lons.append(p["longitude"])
+    # Same Haversine as distance(), evaluated for all candidates in one
+    # vectorized pass. asin(sqrt(.)) is monotonic, so the argmin of the inner
+    # term is the nearest entry (first one on ties, like min()).
+    p = 0.017453292519943295
+    lat, lon = v["latitude"], v["longitude"]
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    a = (
+        0.5
+        - np.cos((lats - lat) * p) / 2
+        + cos(lat * p) * np.cos(lats * p) * (1 - np.cos((lons - lon) * p)) / 2
     )
+    return data[int(np.argmin(a))]
+
+_BASE64_PATTERN = re.compile(r'^[A-Za-z0-9+/=]+$')
 
 def detect_file_type(content: str) -> str:
     """
@@ -194,8 +223,7 @@ def detect_file_type(content: str) -> str:
         str: 'json' or 'encrypted'
     """
     # Try to detect if it's base64 encoded
-    base64_pattern = r'^[A-Za-z0-9+/=]+$'
-    if re.match(base64_pattern, content.strip()):
+    if _BASE64_PATTERN.match(content.strip()):
         return 'encrypted'
     
     # Try to detect if it's JSON
@@ -294,6 +322,30 @@ def validate_data_timestamps(data: Dict[str, Any]) -> tuple[bool, list]:
     is_valid = len(malformed_timestamps) == 0
     return is_valid, malformed_timestamps
 
+def _json_default(obj):
+    """json.dump fallback matching the data types' write_to_json serializer."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, via orjson when available."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default).encode('utf-8')
+
+
+def loads_json(content: Any) -> Any:
+    """Parse JSON from ``str`` or ``bytes``, via orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 def save_data_file(
     data: Dict[str, Any],
     file_path: str,
@@ -329,19 +381,48 @@ def save_data_file(
         if encrypt:
             if handler is None:
                 raise ValueError("Encryption requested but no handler provided")
-            encrypted_data = handler.encrypt_and_sign(data_dict)
+            encrypted_data = handler.encrypt_and_sign(dumps_json(data_dict))
             with open(file_path, 'w') as f:
                 f.write(encrypted_data)
         else:
-            if hasattr(data, 'write_to_json'):
-                data.write_to_json(file_path)
-            else:
-                with open(file_path, 'w') as f:
-                    json.dump(data_dict, f, indent=2)
+            # Write the dict that was just validated rather than going through
+            # write_to_json, which would build (and re-stamp) it a second time.
+            # Combined sets stream their sub-datasets instead of one big blob.
+            with open(file_path, 'wb') as f:
+                if hasattr(data, 'write_to_stream'):
+                    data.write_to_stream(f)
+                else:
+                    f.write(dumps_json(data_dict, indent=True))
     except Exception as e:
         logging.error(f"Error saving file {file_path}: {e}")
         raise
-    
+
+def link_or_copy(src: str, dst: str) -> None:
+    """
+    Make ``dst`` an alias of ``src``: a hardlink when possible, a copy otherwise.
+
+    A hardlink avoids writing the same bytes twice; filesystems without
+    hardlink support (or a cross-device ``dst``) fall back to a copy. The new
+    entry is created under a temporary name and renamed over ``dst``, so a
+    reader never sees ``dst`` missing or half-written.
+
+    Args:
+        src (str): Existing file
+        dst (str): Alias path (replaced if it exists)
+    """
+    # rename() is a no-op when both names are links to one inode, which
+    # would leave the temp link behind; dst is already the alias anyway
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return
+    tmp_path = dst + '.tmp'
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
 def load_data_file(file_path: str, handler: Any = None) -> Dict[str, Any]:
     """
     Load data from a file, automatically detecting if it's encrypted or plain JSON.
@@ -357,14 +438,16 @@ def load_data_file(file_path: str, handler: Any = None) -> Dict[str, Any]:
         with open(file_path, 'r') as f:
             content = f.read().strip()
         
-        file_type = detect_file_type(content)
-        
-        if file_type == 'encrypted':
+        # Same decision as detect_file_type, but plain JSON is parsed once
+        # (by the fast codec) instead of validated first and parsed again
+        if _BASE64_PATTERN.match(content):
             if handler is None:
                 raise ValueError("Encrypted file found but no handler provided")
             return handler.decrypt_and_verify(content)
-        else:
-            return json.loads(content)
+        try:
+            return loads_json(content)
+        except ValueError:  # both json's and orjson's decode errors
+            raise ValueError("File content is neither valid JSON nor base64 encoded")
             
     except Exception as e:
         logging.error(f"Error loading file {file_path}: {e}")
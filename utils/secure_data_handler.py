@@ -1,31 +1,42 @@
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives import hashes, hmac
+from cryptography.hazmat.primitives import hashes, hmac, padding
 from cryptography.hazmat.backends import default_backend
 import os
 import json
 import base64
 
+from utils.helpers import loads_json
+
 class SecureDataHandler:
     def __init__(self, encryption_key, hmac_key):
         self.encryption_key = encryption_key
         self.hmac_key = hmac_key
+        # Validated once; every file of a run is encrypted with the same key.
+        # AES-CBC + HMAC-SHA256 is the published envelope, so this stays on the
+        # OpenSSL-backed primitives rather than switching to an AEAD mode.
+        self._aes = algorithms.AES(encryption_key)
 
     def encrypt_and_sign(self, data) -> str:
-        # Serialize data to JSON
-        json_data = json.dumps(data).encode('utf-8')
+        # Serialize data to JSON; callers that already hold UTF-8 JSON bytes
+        # pass them straight through instead of a dict to re-serialize
+        if isinstance(data, (bytes, bytearray)):
+            json_data = data
+        else:
+            json_data = json.dumps(data).encode('utf-8')
 
         # Generate a random IV
         iv = os.urandom(16)
 
         # Encrypt the data
-        cipher = Cipher(algorithms.AES(self.encryption_key), modes.CBC(iv), backend=default_backend())
+        cipher = Cipher(self._aes, modes.CBC(iv), backend=default_backend())
         encryptor = cipher.encryptor()
         padded_data = self._pad(json_data)
         ciphertext = encryptor.update(padded_data) + encryptor.finalize()
 
-        # Compute HMAC
+        # Compute HMAC over IV + ciphertext (fed separately, no joined copy)
         h = hmac.HMAC(self.hmac_key, hashes.SHA256(), backend=default_backend())
-        h.update(iv + ciphertext)
+        h.update(iv)
+        h.update(ciphertext)
         signature = h.finalize()
 
         # Combine IV, ciphertext, and signature
@@ -36,36 +47,39 @@ class SecureDataHandler:
         # Decode from base64
         data = base64.b64decode(encrypted_data.encode('utf-8'))
 
-        # Extract IV, ciphertext, and signature
-        iv = data[:16]
-        ciphertext = data[16:-32]
-        signature = data[-32:]
+        # Extract IV, ciphertext, and signature (views: the HMAC and cipher
+        # read the ciphertext in place instead of from a sliced copy)
+        view = memoryview(data)
+        iv = bytes(view[:16])
+        ciphertext = view[16:-32]
+        signature = bytes(view[-32:])
 
         # Verify HMAC
         h = hmac.HMAC(self.hmac_key, hashes.SHA256(), backend=default_backend())
-        h.update(iv + ciphertext)
+        h.update(iv)
+        h.update(ciphertext)
         h.verify(signature)
 
         # Decrypt the data
-        cipher = Cipher(algorithms.AES(self.encryption_key), modes.CBC(iv), backend=default_backend())
+        cipher = Cipher(self._aes, modes.CBC(iv), backend=default_backend())
         decryptor = cipher.decryptor()
         padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
         plaintext = self._unpad(padded_plaintext)
 
         # Parse JSON
-        data = json.loads(plaintext.decode('utf-8'))
+        data = loads_json(plaintext)
 
         return data
 
+    # PKCS7 via cryptography's native padder rather than a Python byte loop;
+    # the byte layout is identical, so existing files stay readable.
     def _pad(self, data):
-        block_size = algorithms.AES.block_size // 8
-        padding_size = block_size - (len(data) % block_size)
-        padding = bytes([padding_size] * padding_size)
-        return data + padding
+        padder = padding.PKCS7(algorithms.AES.block_size).padder()
+        return padder.update(data) + padder.finalize()
 
     def _unpad(self, padded_data):
-        padding_size = padded_data[-1]
-        return padded_data[:-padding_size]
+        unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+        return unpadder.update(padded_data) + unpadder.finalize()
 
 if __name__ == "__main__":
     from utils.helpers import load_config
@@ -1,33 +1,57 @@
+import functools
 from timezonefinder import TimezoneFinder
 import reverse_geocoder as rg
-from datetime import datetime, tzinfo
+from datetime import datetime, timedelta, timezone, tzinfo
 import pytz
 from zoneinfo import ZoneInfo
 
+AMSTERDAM_TZ = ZoneInfo('Europe/Amsterdam')
+
 # Ensure start and end times are in the specified timezone
 def ensure_timezone(start_time: datetime, end_time: datetime) -> tuple[datetime, datetime, ZoneInfo]:
     tz = start_time.tzinfo
 
-    if not isinstance(tz, pytz.BaseTzInfo):
-        # If it's not a pytz timezone, try to create one
+    # ZoneInfo and pytz zones are used as-is; anything else is resolved by name
+    if not isinstance(tz, (ZoneInfo, pytz.BaseTzInfo)):
         try:
-            tz = pytz.timezone(str(tz))
-        except:
-            raise ValueError("Could not create a pytz timezone object")
+            tz = ZoneInfo(str(tz))
+        except Exception:
+            raise ValueError("Could not create a timezone object")
     start_time = start_time.astimezone(tz)
     end_time = end_time.astimezone(tz)
     return start_time, end_time, tz
 
+# DST transitions are months apart, so a shorter window with the same offset at
+# both ends has that offset throughout
+_FIXED_OFFSET_MAX_WINDOW = timedelta(days=60)
+
+def fixed_offset_for_window(tz: tzinfo, start_time: datetime, end_time: datetime) -> tzinfo:
+    """Return a fixed-offset timezone equal to tz over [start_time, end_time], else tz itself.
+
+    Converting with a datetime.timezone skips the zone's transition lookup, and
+    isoformat() gives the same '+01:00'/'+02:00' suffix.
+    """
+    offset = start_time.astimezone(tz).utcoffset()
+    if end_time - start_time <= _FIXED_OFFSET_MAX_WINDOW and end_time.astimezone(tz).utcoffset() == offset:
+        return timezone(offset)
+    return tz
+
+@functools.lru_cache(maxsize=1)
+def _timezone_finder() -> TimezoneFinder:
+    # TimezoneFinder loads its polygon data on construction; build it once
+    return TimezoneFinder()
+
+@functools.lru_cache(maxsize=128)
 def get_timezone(lat:float, lon:float) -> ZoneInfo:
-    tf = TimezoneFinder()
-    timezone_str = tf.timezone_at(lat=float(lat), lng=float(lon))
+    timezone_str = _timezone_finder().timezone_at(lat=float(lat), lng=float(lon))
     if timezone_str is None:
         return None
     return ZoneInfo(timezone_str)
 
+# Coordinates come from config, so the same few points are looked up every run
+@functools.lru_cache(maxsize=128)
 def get_timezone_and_country(lat, lng):
-    tf = TimezoneFinder()
-    timezone_str = tf.timezone_at(lat=lat, lng=lng)
+    timezone_str = _timezone_finder().timezone_at(lat=lat, lng=lng)
     
     # Get country code
     result = rg.search((lat, lng), mode=1)  # mode=1 returns only one result
@@ -135,14 +159,12 @@ def normalize_timestamp_to_amsterdam(dt: datetime) -> datetime:
         >>> normalized.isoformat()
         '2025-10-24T12:00:00+02:00'
     """
-    amsterdam_tz = ZoneInfo('Europe/Amsterdam')
-
     # If naive, assume it's already in Amsterdam time
     if dt.tzinfo is None:
-        return localize_naive_datetime(dt, amsterdam_tz)
+        return localize_naive_datetime(dt, AMSTERDAM_TZ)
 
     # If already timezone-aware, convert to Amsterdam
-    return dt.astimezone(amsterdam_tz)
+    return dt.astimezone(AMSTERDAM_TZ)
 
 def validate_timestamp_format(timestamp_str: str) -> bool:
     """